@@ -3,194 +3,284 @@ API Client for external services used by voice commands.
 Handles weather, news, and other third-party API integrations.
 """
 import os
+import atexit
+import asyncio
 import requests
+import httpx
+import orjson
 import logging
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import heapq
+import itertools
+import threading
+import time
+from threading import RLock
+from concurrent.futures import ThreadPoolExecutor
+from cachetools import LRUCache, TTLCache
 from typing import Dict, Any, Optional
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 logger = logging.getLogger(__name__)
 
-class WeatherAPIClient:
-    """Client for OpenWeatherMap API integration."""
+def _create_session() -> requests.Session:
+    """Create a pooled session that keeps connections alive between calls."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=32,
+        max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+# One process-wide session shared by the third-party API clients; urllib3
+# keeps a separate pool per host, so both APIs reuse their own connections
+_HTTP = _create_session()
+
+class _BaseAPIClient:
+    """Shared request plumbing for the third-party JSON API clients."""
     
-    def __init__(self):
-        self.api_key = os.getenv('OPENWEATHER_API_KEY')
-        self.base_url = "http://api.openweathermap.org/data/2.5"
+    missing_key_error = "API key not configured"
+    
+    def __init__(self, api_key: Optional[str], base_url: str, timeout: float = 10):
+        self.api_key = api_key
+        self.base_url = base_url
+        self.session = _HTTP
+        self._timeout = timeout
+        # (etag, last_modified, body) of the last good response per request,
+        # replayed as validators so unchanged content comes back as a bodyless 304
+        self._validators = LRUCache(maxsize=256)
+        self._validators_lock = RLock()
         
-    def get_current_weather(self, location: str, units: str = "imperial") -> Dict[str, Any]:
-        """Get current weather for a location."""
+    def _get(self, url: str, params: Dict[str, Any], label: str) -> Dict[str, Any]:
+        """GET a JSON endpoint and return the decoded body."""
         if not self.api_key:
-            raise ValueError("OpenWeatherMap API key not configured")
+            raise ValueError(self.missing_key_error)
             
-        try:
-            url = f"{self.base_url}/weather"
-            params = {
-                'q': location,
-                'appid': self.api_key,
-                'units': units
-            }
+        key = (url, tuple(sorted(params.items())))
+        with self._validators_lock:
+            previous = self._validators.get(key)
+        headers = {}
+        if previous:
+            etag, last_modified, _ = previous
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
             
-            response = requests.get(url, params=params, timeout=10)
+        try:
+            response = self.session.get(url, params=params, headers=headers, timeout=self._timeout)
+            if response.status_code == 304 and previous:
+                return previous[2]
             response.raise_for_status()
-            return response.json()
+            # orjson parses the raw bytes directly, skipping requests' charset sniffing
+            data = orjson.loads(response.content)
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+            if etag or last_modified:
+                with self._validators_lock:
+                    self._validators[key] = (etag, last_modified, data)
+            return data
             
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Weather API request failed: {e}")
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
+            logger.error("%s request failed: %s", label, e)
             raise
+    
+    def close(self) -> None:
+        """Release the pooled connections held by the session."""
+        self.session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+
+class WeatherAPIClient(_BaseAPIClient):
+    """Client for OpenWeatherMap API integration."""
+    
+    missing_key_error = "OpenWeatherMap API key not configured"
+    
+    def __init__(self):
+        super().__init__(os.getenv('OPENWEATHER_API_KEY'), "http://api.openweathermap.org/data/2.5")
+        self._weather_url = f"{self.base_url}/weather"
+        self._auth = {'appid': self.api_key}
+        self._forecast_url = f"{self.base_url}/forecast"
+        # Weather changes slowly, so repeated voice queries are served from memory
+        self._cur_cache = TTLCache(maxsize=256, ttl=600)
+        self._fc_cache = TTLCache(maxsize=256, ttl=1800)
+        self._lock = RLock()
+        
+    def invalidate(self, location: str):
+        """Drop cached current weather and forecast entries for a location."""
+        location = location.lower()
+        with self._lock:
+            for cache in (self._cur_cache, self._fc_cache):
+                for key in [k for k in cache.keys() if k[0] == location]:
+                    cache.pop(key, None)
+                    
+    def _cached_get(self, cache: TTLCache, url: str, location: str, units: str, label: str) -> Dict[str, Any]:
+        """Serve from the given cache, fetching and storing on a miss."""
+        key = (location.lower(), units)
+        with self._lock:
+            cached = cache.get(key)
+        if cached is not None:
+            return cached
+            
+        data = self._get(url, {'q': location, 'units': units, **self._auth}, label)
+        # Only successful responses reach the cache; errors raise above
+        with self._lock:
+            cache[key] = data
+        return data
+        
+    def get_current_weather(self, location: str, units: str = "imperial") -> Dict[str, Any]:
+        """Get current weather for a location."""
+        return self._cached_get(self._cur_cache, self._weather_url, location, units, "Weather API")
             
     def get_weather_forecast(self, location: str, units: str = "imperial") -> Dict[str, Any]:
         """Get 5-day weather forecast for a location."""
-        if not self.api_key:
-            raise ValueError("OpenWeatherMap API key not configured")
-            
-        try:
-            url = f"{self.base_url}/forecast"
-            params = {
-                'q': location,
-                'appid': self.api_key,
-                'units': units
-            }
-            
-            response = requests.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            return response.json()
-            
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Weather forecast API request failed: {e}")
-            raise
+        return self._cached_get(self._fc_cache, self._forecast_url, location, units, "Weather forecast API")
 
-class NewsAPIClient:
+class NewsAPIClient(_BaseAPIClient):
     """Client for NewsAPI.org integration."""
     
+    missing_key_error = "News API key not configured"
+    
     def __init__(self):
-        self.api_key = os.getenv('NEWS_API_KEY')
-        self.base_url = "https://newsapi.org/v2"
+        super().__init__(os.getenv('NEWS_API_KEY'), "https://newsapi.org/v2")
+        self._headlines_url = f"{self.base_url}/top-headlines"
+        self._auth = {'apiKey': self.api_key}
+        self._everything_url = f"{self.base_url}/everything"
         
     def get_top_headlines(self, category: str = None, country: str = "us", page_size: int = 5) -> Dict[str, Any]:
         """Get top headlines from NewsAPI."""
-        if not self.api_key:
-            raise ValueError("News API key not configured")
-            
-        try:
-            url = f"{self.base_url}/top-headlines"
-            params = {
-                'apiKey': self.api_key,
-                'country': country,
-                'pageSize': page_size
-            }
-            
-            if category:
-                params['category'] = category.lower()
-                
-            response = requests.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            return response.json()
-            
-        except requests.exceptions.RequestException as e:
-            logger.error(f"News API request failed: {e}")
-            raise
+        params = {'country': country, 'pageSize': page_size, **self._auth}
+        if category:
+            params['category'] = category.lower()
+        return self._get(self._headlines_url, params, "News API")
             
     def search_news(self, query: str, sort_by: str = "publishedAt", page_size: int = 5) -> Dict[str, Any]:
         """Search for news articles by query."""
-        if not self.api_key:
-            raise ValueError("News API key not configured")
-            
-        try:
-            url = f"{self.base_url}/everything"
-            params = {
-                'apiKey': self.api_key,
-                'q': query,
-                'sortBy': sort_by,
-                'pageSize': page_size
-            }
-                
-            response = requests.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            return response.json()
-            
-        except requests.exceptions.RequestException as e:
-            logger.error(f"News search API request failed: {e}")
-            raise
+        params = {'q': query, 'sortBy': sort_by, 'pageSize': page_size, **self._auth}
+        return self._get(self._everything_url, params, "News search API")
+
+# Process-wide pool that runs due reminder/timer callbacks, so no scheduler
+# instance spawns threads of its own per task
+_EXEC = ThreadPoolExecutor(max_workers=16, thread_name_prefix='task-scheduler')
 
 class TaskScheduler:
-    """Simple task scheduler for reminders and timers."""
+    """Task scheduler for reminders and timers driven by a single worker thread."""
     
     def __init__(self):
         self.scheduled_tasks = {}
+        # Min-heap of (due, seq, task_id, callback, args, kwargs) ordered by due time
+        self._heap = []
+        self._seq = itertools.count()
+        self._cv = threading.Condition()
+        self._cancelled = set()
+        # Seqs handed to the executor and not finished yet; too late to cancel
+        self._inflight = set()
+        self._worker = threading.Thread(target=self._run, daemon=True)
+        self._worker.start()
+        
+    def _run(self):
+        """Wait for the earliest task to come due and hand it to the executor."""
+        while True:
+            with self._cv:
+                while not self._heap:
+                    self._cv.wait()
+                timeout = self._heap[0][0] - time.monotonic()
+                if timeout > 0:
+                    # Woken early by a new or cancelled task; re-check the heap top
+                    self._cv.wait(timeout=timeout)
+                    continue
+                due, seq, task_id, callback, args, kwargs = heapq.heappop(self._heap)
+                if seq in self._cancelled:
+                    self._cancelled.discard(seq)
+                    continue
+                self._inflight.add(seq)
+            _EXEC.submit(self._execute, seq, task_id, callback, args, kwargs)
+            
+    def _execute(self, seq, task_id, callback_func, args, kwargs):
+        """Run a due task and drop it from tracking."""
+        task_type = self.scheduled_tasks.get(task_id, {}).get('type', 'task')
+        try:
+            callback_func(*args, **kwargs)
+        except Exception as e:
+            logger.error("Error executing %s %s: %s", task_type, task_id, e)
+        finally:
+            # Clean up, unless the id has since been reused for a newer task
+            with self._cv:
+                self._inflight.discard(seq)
+                if self.scheduled_tasks.get(task_id, {}).get('seq') == seq:
+                    del self.scheduled_tasks[task_id]
+                    
+    def _schedule(self, task_id: str, delay_seconds: float, callback_func, args, kwargs, task_info: Dict[str, Any]):
+        """Push a task onto the heap and wake the worker."""
+        with self._cv:
+            previous = self.scheduled_tasks.get(task_id)
+            if previous and previous['seq'] not in self._inflight:
+                self._cancelled.add(previous['seq'])
+            seq = next(self._seq)
+            scheduled_at = time.monotonic()
+            due = scheduled_at + delay_seconds
+            heapq.heappush(self._heap, (due, seq, task_id, callback_func, args, kwargs))
+            self.scheduled_tasks[task_id] = dict(task_info, seq=seq, scheduled_at_monotonic=scheduled_at, due=due)
+            self._cv.notify()
         
     def schedule_reminder(self, reminder_id: str, delay_minutes: int, callback_func, *args, **kwargs):
         """Schedule a reminder to execute after delay."""
-        import threading
-        import time
-        
-        def execute_reminder():
-            time.sleep(delay_minutes * 60)
-            try:
-                callback_func(*args, **kwargs)
-            except Exception as e:
-                logger.error(f"Error executing reminder {reminder_id}: {e}")
-            finally:
-                # Clean up
-                if reminder_id in self.scheduled_tasks:
-                    del self.scheduled_tasks[reminder_id]
-        
-        thread = threading.Thread(target=execute_reminder, daemon=True)
-        self.scheduled_tasks[reminder_id] = {
-            'thread': thread,
-            'scheduled_at': datetime.utcnow(),
+        self._schedule(reminder_id, delay_minutes * 60, callback_func, args, kwargs, {
             'delay_minutes': delay_minutes,
             'type': 'reminder'
-        }
-        thread.start()
+        })
         
     def schedule_timer(self, timer_id: str, duration_seconds: int, callback_func, *args, **kwargs):
         """Schedule a timer to execute after duration."""
-        import threading
-        import time
-        
-        def execute_timer():
-            time.sleep(duration_seconds)
-            try:
-                callback_func(*args, **kwargs)
-            except Exception as e:
-                logger.error(f"Error executing timer {timer_id}: {e}")
-            finally:
-                # Clean up
-                if timer_id in self.scheduled_tasks:
-                    del self.scheduled_tasks[timer_id]
-        
-        thread = threading.Thread(target=execute_timer, daemon=True)
-        self.scheduled_tasks[timer_id] = {
-            'thread': thread,
-            'scheduled_at': datetime.utcnow(),
+        self._schedule(timer_id, duration_seconds, callback_func, args, kwargs, {
             'duration_seconds': duration_seconds,
             'type': 'timer'
-        }
-        thread.start()
+        })
         
     def cancel_task(self, task_id: str) -> bool:
-        """Cancel a scheduled task."""
-        if task_id in self.scheduled_tasks:
-            # Note: We can't actually stop a running thread in Python,
-            # but we can remove it from our tracking
+        """Cancel a scheduled task; False if it is unknown or already running."""
+        with self._cv:
+            task_info = self.scheduled_tasks.get(task_id)
+            if task_info is None or task_info['seq'] in self._inflight:
+                return False
             del self.scheduled_tasks[task_id]
+            # The worker skips cancelled entries when they reach the top of the heap
+            self._cancelled.add(task_info['seq'])
+            self._cv.notify()
             return True
-        return False
         
     def get_active_tasks(self) -> Dict[str, Any]:
         """Get list of active scheduled tasks."""
+        with self._cv:
+            tasks = list(self.scheduled_tasks.items())
+        # Timing is tracked on the monotonic clock; wall-clock timestamps are
+        # only materialized here, for display
+        now = datetime.now(timezone.utc)
+        now_monotonic = time.monotonic()
         return {tid: {
-            'scheduled_at': task_info['scheduled_at'].isoformat(),
+            'scheduled_at': (now - timedelta(seconds=now_monotonic - task_info['scheduled_at_monotonic'])).isoformat(),
             'type': task_info['type'],
             'delay_minutes': task_info.get('delay_minutes'),
             'duration_seconds': task_info.get('duration_seconds')
-        } for tid, task_info in self.scheduled_tasks.items()}
+        } for tid, task_info in tasks}
 
 # Global instances
 weather_client = WeatherAPIClient()
 news_client = NewsAPIClient()
 task_scheduler = TaskScheduler()
 
+# Both clients share _HTTP, so either close tears the pool down; closing an
+# already-closed session is a no-op
+atexit.register(weather_client.close)
+atexit.register(news_client.close)
+
 def get_weather_client() -> WeatherAPIClient:
     """Get weather API client instance."""
     return weather_client
@@ -203,48 +293,86 @@ def get_task_scheduler() -> TaskScheduler:
     """Get task scheduler instance."""
     return task_scheduler
 
-import requests
-import json
-from typing import Dict, Any, Optional
-import logging
-
-logger = logging.getLogger(__name__)
-
 class VoiceAssistantAPIClient:
     """Python client for the Voice Assistant API"""
     
+    ENDPOINTS = (
+        '/health',
+        '/api/auth/session',
+        '/api/calendar/today',
+        '/api/calendar/upcoming',
+        '/api/calendar/create',
+        '/api/calendar/next-meeting',
+        '/api/calendar/free-time',
+        '/api/voice/start',
+        '/api/voice/stop',
+        '/api/voice/status',
+    )
+    
     def __init__(self, base_url: str = "http://localhost:5000"):
         self.base_url = base_url.rstrip('/')
+        self._urls = {endpoint: f"{self.base_url}{endpoint}" for endpoint in self.ENDPOINTS}
         self.session = requests.Session()
         self.session.headers.update({'Content-Type': 'application/json'})
+        # Larger pool so concurrent voice threads don't evict warm connections,
+        # plus backoff on transient backend failures. Only idempotent verbs are
+        # retried on a 5xx/429, since resending a POST could create an event or
+        # start voice twice; once retries run out the last response is returned
+        # (raise_on_status=False) so _make_request still sees its status code.
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(['GET', 'PUT', 'DELETE']),
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=32, max_retries=retry)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self._verbs = {
+            'GET': self.session.get,
+            'POST': self.session.post,
+            'PUT': self.session.put,
+            'DELETE': self.session.delete,
+        }
         
     def _make_request(self, method: str, endpoint: str, data: Optional[Dict] = None, params: Optional[Dict] = None) -> Dict[str, Any]:
         """Make HTTP request to the API"""
-        url = f"{self.base_url}{endpoint}"
+        url = self._urls.get(endpoint) or f"{self.base_url}{endpoint}"
         
         try:
-            if method.upper() == 'GET':
-                response = self.session.get(url, params=params)
-            elif method.upper() == 'POST':
-                response = self.session.post(url, json=data)
-            elif method.upper() == 'PUT':
-                response = self.session.put(url, json=data)
-            elif method.upper() == 'DELETE':
-                response = self.session.delete(url)
-            else:
+            method = method.upper()
+            send = self._verbs.get(method)
+            if send is None:
                 raise ValueError(f"Unsupported HTTP method: {method}")
+            if method == 'GET':
+                response = send(url, params=params)
+            elif method == 'DELETE':
+                response = send(url)
+            else:
+                response = send(url, json=data)
             
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
             
-        except requests.exceptions.RequestException as e:
-            logger.error(f"API request failed: {e}")
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
+            logger.error("API request failed: %s", e)
             return {
                 'success': False,
                 'error': str(e),
                 'status_code': getattr(e.response, 'status_code', None) if hasattr(e, 'response') else None
             }
     
+    def close(self) -> None:
+        """Release the pooled connections held by the session"""
+        self.session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+    
     def health_check(self) -> Dict[str, Any]:
         """Check API health"""
         return self._make_request('GET', '/health')
@@ -285,27 +413,124 @@ class VoiceAssistantAPIClient:
         """Get voice assistant status"""
         return self._make_request('GET', '/api/voice/status')
 
+class AsyncVoiceAssistantAPIClient:
+    """Async Python client for the Voice Assistant API.
+
+    All calls share one keep-alive connection pool (multiplexed over HTTP/2
+    when the server supports it), so independent endpoints can be awaited
+    together with asyncio.gather instead of paying one round trip each.
+    """
+    
+    def __init__(self, base_url: str = "http://localhost:5000"):
+        self.base_url = base_url.rstrip('/')
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            timeout=httpx.Timeout(30.0),
+            headers={'Content-Type': 'application/json'}
+        )
+        
+    async def _make_request(self, method: str, endpoint: str, data: Optional[Dict] = None, params: Optional[Dict] = None) -> Dict[str, Any]:
+        """Make HTTP request to the API"""
+        try:
+            response = await self._client.request(method.upper(), endpoint, json=data, params=params)
+            response.raise_for_status()
+            return orjson.loads(response.content)
+            
+        except (httpx.HTTPError, orjson.JSONDecodeError) as e:
+            logger.error("API request failed: %s", e)
+            return {
+                'success': False,
+                'error': str(e),
+                'status_code': e.response.status_code if isinstance(e, httpx.HTTPStatusError) else None
+            }
+    
+    async def aclose(self):
+        """Close the underlying connection pool"""
+        await self._client.aclose()
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc):
+        await self.aclose()
+    
+    async def health_check(self) -> Dict[str, Any]:
+        """Check API health"""
+        return await self._make_request('GET', '/health')
+    
+    async def get_session_info(self) -> Dict[str, Any]:
+        """Get current session information"""
+        return await self._make_request('GET', '/api/auth/session')
+    
+    async def get_today_schedule(self) -> Dict[str, Any]:
+        """Get today's schedule"""
+        return await self._make_request('GET', '/api/calendar/today')
+    
+    async def get_upcoming_events(self, days: int = 7) -> Dict[str, Any]:
+        """Get upcoming events"""
+        return await self._make_request('GET', '/api/calendar/upcoming', params={'days': days})
+    
+    async def create_event(self, event_text: str) -> Dict[str, Any]:
+        """Create a new calendar event"""
+        return await self._make_request('POST', '/api/calendar/create', data={'event_text': event_text})
+    
+    async def get_next_meeting(self) -> Dict[str, Any]:
+        """Get next meeting"""
+        return await self._make_request('GET', '/api/calendar/next-meeting')
+    
+    async def get_free_time(self) -> Dict[str, Any]:
+        """Get free time today"""
+        return await self._make_request('GET', '/api/calendar/free-time')
+    
+    async def start_voice_assistant(self) -> Dict[str, Any]:
+        """Start voice assistant"""
+        return await self._make_request('POST', '/api/voice/start')
+    
+    async def stop_voice_assistant(self) -> Dict[str, Any]:
+        """Stop voice assistant"""
+        return await self._make_request('POST', '/api/voice/stop')
+    
+    async def get_voice_status(self) -> Dict[str, Any]:
+        """Get voice assistant status"""
+        return await self._make_request('GET', '/api/voice/status')
+
 # Example usage and testing
+async def _run_self_test(client: AsyncVoiceAssistantAPIClient):
+    """Issue the independent self-test calls concurrently on one connection pool."""
+    async with client:
+        results = await asyncio.gather(
+            client.health_check(),
+            client.get_today_schedule(),
+            client.create_event("Test API call event tomorrow at 3pm"),
+            return_exceptions=True
+        )
+    return [
+        {'success': False, 'error': str(result)} if isinstance(result, Exception) else result
+        for result in results
+    ]
+
 if __name__ == "__main__":
     # Configure logging
     logging.basicConfig(level=logging.INFO)
     
     # Create client
-    client = VoiceAssistantAPIClient()
+    client = AsyncVoiceAssistantAPIClient()
     
     print("🧪 Testing Voice Assistant API Client - Chirag's Backend")
     print("=" * 60)
     
+    health, schedule, event_result = asyncio.run(_run_self_test(client))
+    
     # Test health check
     print("\n1. Health Check:")
-    health = client.health_check()
     print(f"   Status: {'✅ Healthy' if health.get('success') else '❌ Unhealthy'}")
     if health.get('success'):
         print(f"   Calendar Connected: {health.get('data', {}).get('calendar_connected', 'Unknown')}")
     
     # Test today's schedule
     print("\n2. Today's Schedule:")
-    schedule = client.get_today_schedule()
     if schedule.get('success'):
         print(f"   Schedule: {schedule.get('data', {}).get('schedule', 'No schedule')}")
     else:
@@ -313,7 +538,6 @@ if __name__ == "__main__":
     
     # Test creating an event
     print("\n3. Creating Test Event:")
-    event_result = client.create_event("Test API call event tomorrow at 3pm")
     if event_result.get('success'):
         print(f"   Result: {event_result.get('data', {}).get('result', 'Event created')}")
     else:
@@ -1,95 +1,142 @@
 # backend/app.py - Enhanced Version with Integrated Fixes
 import os
+
+# Cooperative green-thread server for Socket.IO; must patch before anything
+# else imports socket/threading
+if os.getenv('SOCKETIO_ASYNC_MODE', 'threading') == 'eventlet':
+    import eventlet
+    eventlet.monkey_patch()
+    # psycopg2 talks to Postgres from C, which the monkey-patching can't see;
+    # psycogreen makes its waits cooperative so queries don't block the hub
+    try:
+        from psycogreen.eventlet import patch_psycopg
+        patch_psycopg()
+    except ImportError:
+        pass
+
 import sys
+import atexit
+import functools
 import logging
+import logging.config
+import logging.handlers
+import queue
+import socket
+import webbrowser
+
+# Emoji and pictograph codepoints that break some consoles; built once so
+# stripping is a single str.translate pass per message
+_STRIP = dict.fromkeys(
+    [*range(0x2300, 0x2400), *range(0x2600, 0x27C0), *range(0x2B00, 0x2C00),
+     *range(0x1F000, 0x1FB00), 0x200D, 0xFE0F]
+)
 
 # Configure clean logging first - remove problematic characters
 class CleanFormatter(logging.Formatter):
     def format(self, record):
-        # Remove all emoji and special unicode characters from log messages
-        if hasattr(record, 'msg') and isinstance(record.msg, str):
-            # Replace problematic characters
-            record.msg = record.msg.encode('ascii', 'ignore').decode('ascii')
+        # Remove emoji from log messages
+        if isinstance(record.msg, str):
+            record.msg = record.msg.translate(_STRIP)
         return super().format(record)
 
-# Setup clean console output
-if hasattr(sys.stdout, "reconfigure"):
-    try:
-        sys.stdout.reconfigure(encoding="utf-8", errors="ignore")
-        sys.stderr.reconfigure(encoding="utf-8", errors="ignore")
-    except Exception:
-        pass
+def _route_through_queue(target_logger):
+    """Move a logger's handlers behind a QueueListener so emitting never blocks on I/O"""
+    handlers = target_logger.handlers[:]
+    if not handlers:
+        return
+    log_queue = queue.Queue(-1)
+    for handler in handlers:
+        target_logger.removeHandler(handler)
+    target_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
+def _init_logging_once():
+    """Configure console encoding and logging a single time per process.
+    
+    The root QueueHandler doubles as the marker, so importing this module
+    under a second name (app vs backend.app) doesn't stack another handler.
+    """
+    root = logging.getLogger()
+    if any(isinstance(h, logging.handlers.QueueHandler) for h in root.handlers):
+        return
+    
+    # Clean console output
+    if hasattr(sys.stdout, "reconfigure"):
+        try:
+            sys.stdout.reconfigure(encoding="utf-8", errors="ignore")
+            sys.stderr.reconfigure(encoding="utf-8", errors="ignore")
+        except Exception:
+            pass
+    
+    # One clean stdout handler on the root logger, which every other logger
+    # (flask.app, werkzeug, backend.*) propagates to
+    logging.config.dictConfig({
+        'version': 1,
+        'disable_existing_loggers': False,
+        'formatters': {
+            'clean': {
+                '()': CleanFormatter,
+                'fmt': '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+            },
+        },
+        'handlers': {
+            'console': {
+                'class': 'logging.StreamHandler',
+                'stream': 'ext://sys.stdout',
+                'formatter': 'clean',
+            },
+        },
+        'root': {'level': 'INFO', 'handlers': ['console']},
+    })
+    _route_through_queue(root)
 
-# Configure logging with clean formatter
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+_init_logging_once()
+logger = logging.getLogger(__name__)
 
-# Apply clean formatter to all loggers
-for logger_name in ['flask.app', 'werkzeug', 'backend', __name__]:
-    logger = logging.getLogger(logger_name)
-    for handler in logger.handlers:
-        handler.setFormatter(CleanFormatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
 # Apply Flask compatibility patches BEFORE importing Flask
 from .flask_patch import apply_flask_patches
 apply_flask_patches()
 
-from flask import Flask, request, jsonify, session, g, render_template_string
-from flask_sqlalchemy import SQLAlchemy
+from flask import Flask, Response, request, jsonify, session, g
+from flask.json.provider import DefaultJSONProvider
+import orjson
+from sqlalchemy import and_, or_
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
-from datetime import datetime, timedelta, timezone
-import uuid
+from datetime import datetime, timezone
 import time
-import traceback
 import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from flask_cors import CORS
-from flask_socketio import SocketIO, emit, join_room, leave_room
-import webbrowser
-import queue
+from flask_socketio import SocketIO, emit
+
+try:
+    from whitenoise import WhiteNoise
+    WHITENOISE_AVAILABLE = True
+except ImportError:
+    WhiteNoise = None
+    WHITENOISE_AVAILABLE = False
+
+try:
+    from flask_session import Session
+    FLASK_SESSION_AVAILABLE = True
+except ImportError:
+    Session = None
+    FLASK_SESSION_AVAILABLE = False
 
 # Load environment variables from .env file
 from dotenv import load_dotenv
 load_dotenv()
 
 # Import enhanced utilities
-from .integration_utils import (
-    enhanced_error_handler, 
-    safe_database_operation,
-    get_user_session_info,
-    create_api_response,
-    validate_json_request,
-    setup_enhanced_logging
-)
-
-# Configure enhanced logging with clean output
-def setup_clean_logging():
-    """Setup clean logging without problematic characters"""
-    logger = logging.getLogger(__name__)
-    logger.setLevel(logging.INFO)
-    
-    # Remove existing handlers
-    for handler in logger.handlers[:]:
-        logger.removeHandler(handler)
-    
-    # Create clean handler
-    handler = logging.StreamHandler(sys.stdout)
-    handler.setFormatter(CleanFormatter('%(asctime)s - %(levelname)s - %(message)s'))
-    logger.addHandler(handler)
-    
-    return logger
-
-# Setup clean logging
-logger = setup_clean_logging()
+from .integration_utils import get_redis_client
 
 # Clean log messages without problematic characters
 def clean_log(message, level='INFO'):
     """Log a clean message without special characters"""
-    clean_message = message.encode('ascii', 'ignore').decode('ascii')
+    clean_message = message.translate(_STRIP)
     if level == 'INFO':
         logger.info(clean_message)
     elif level == 'ERROR':
@@ -105,12 +152,11 @@ clean_log(f"ElevenLabs voice ID: {os.environ.get('ELEVENLABS_VOICE_ID', 'Not set
 
 # Import configuration and other modules
 from .config import config
-from .models import db, Log, User
+from .models import db, Log
 from .auth_service import AuthService, require_auth, optional_auth
 from .google_calendar_integration import (
     get_today_schedule,
     get_upcoming_events,
-    create_event_from_conversation,
     get_next_meeting,
     get_free_time_today,
     test_calendar_connection,
@@ -125,24 +171,126 @@ from .voice_assistant import VoiceAssistant, test_voice_synthesis, initialize_el
 from .microphone_handler import MicrophoneHandler
 # Import the enhanced socket fix
 from .socket_fix import patch_socketio_emit
+from .voice_sessions import VoiceSessionCookie, create_voice_session_store
+from .schemas import (
+    parse_request,
+    error_message,
+    RegisterRequest,
+    LoginRequest,
+    ChangePasswordRequest,
+    RescheduleEventRequest,
+    EventReminderRequest,
+    TranscriptRequest,
+    VoiceInputRequest
+)
 
-# Voice session management (replace app.state usage)
-voice_sessions = {}  # Global dictionary to track voice sessions
+def _current_uid_str():
+    """String form of the authenticated user's id, converted once per request."""
+    if 'uid_str' not in g:
+        user = getattr(request, 'current_user', None)
+        g.uid_str = str(user.id) if user else None
+    return g.uid_str
+
+def _current_room():
+    """Socket.IO room of the authenticated user, built once per request."""
+    if 'user_room' not in g:
+        uid_str = _current_uid_str()
+        g.user_room = f"user_{uid_str}" if uid_str else None
+    return g.user_room
+
+@functools.lru_cache(maxsize=4)
+def _utc_second_prefix(second):
+    return time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(second))
+
+def _fast_utcnow_iso():
+    """Current UTC time in datetime.isoformat() form; the date/time part is cached per second."""
+    now = time.time()
+    second = int(now)
+    return f"{_utc_second_prefix(second)}.{int((now - second) * 1e6):06d}+00:00"
+
+def _room_has_clients(room):
+    """Whether anyone is subscribed to room.
+    
+    With a Redis message queue other workers may hold the subscribers, which
+    this process can't see, so the answer is always yes there.
+    """
+    if _SOCKETIO_MESSAGE_QUEUE:
+        return True
+    return bool(socketio.server.manager.rooms.get('/', {}).get(room))
+
+# Single worker so deferred emits still reach clients in the order they were made
+_emit_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='socketio-emit')
+
+def _emit_to_room(event, payload, room, defer=False):
+    """Emit to a user's room, skipping the encode entirely when nobody is in it.
+
+    With defer, the encode and send (a Redis publish when a message queue is
+    configured) happen on a background worker after the handler returns.
+    """
+    if room and _room_has_clients(room):
+        if defer:
+            _emit_executor.submit(socketio.emit, event, payload, room=room)
+        else:
+            socketio.emit(event, payload, room=room)
+
+def _fmt_ns(ns):
+    """Format a time.time_ns() value as an ISO-8601 UTC string."""
+    if ns is None:
+        return None
+    return datetime.fromtimestamp(ns / 1e9, tz=timezone.utc).isoformat()
 
 # Global microphone handler
 microphone_handler = None
 
-# UTF-8 console fix
-if hasattr(sys.stdout, "reconfigure"):
-    try:
-        sys.stdout.reconfigure(encoding="utf-8")
-        sys.stderr.reconfigure(encoding="utf-8")
-    except Exception:
-        pass
+class ORJSONProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson for jsonify() and request.get_json()"""
+    
+    def _dumps_bytes(self, obj):
+        # Types orjson can't handle natively fall back to Flask's default encoder
+        return orjson.dumps(
+            obj,
+            default=self.default,
+            option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+        )
+    
+    def dumps(self, obj, **kwargs):
+        return self._dumps_bytes(obj).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        # jsonify() bodies go out as orjson's bytes, skipping the str round trip
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self._dumps_bytes(obj), mimetype=self.mimetype)
+
+class SocketIOJSON:
+    """orjson behind the dumps/loads module interface python-socketio expects"""
+    
+    @staticmethod
+    def dumps(obj, **kwargs):
+        # python-socketio passes stdlib options such as separators; orjson's
+        # output is already compact, so they are ignored
+        return orjson.dumps(obj, default=DefaultJSONProvider.default).decode()
+    
+    @staticmethod
+    def loads(s, **kwargs):
+        return orjson.loads(s)
 
 # Flask app setup
-app = Flask(__name__, instance_relative_config=True)
-app.config.from_object(config['development'])
+app_config = config['development']
+# Behind nginx (see nginx.conf.example) static files are served by the proxy,
+# so Flask registers no static folder or routes at all
+app = Flask(
+    __name__,
+    instance_relative_config=True,
+    static_folder='static' if app_config.SERVE_STATIC else None
+)
+app.json = ORJSONProvider(app)
+app.config.from_object(app_config)
+# Decided from app.debug, like the WhiteNoise setup below, so the selected
+# config class (not just FLASK_DEBUG) controls static caching
+app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 0 if app.debug else app.config['STATIC_MAX_AGE']
 
 # Enable CORS for the app
 CORS(app, origins=app.config.get('ALLOWED_ORIGINS', '*'))
@@ -150,18 +298,55 @@ CORS(app, origins=app.config.get('ALLOWED_ORIGINS', '*'))
 # Initialize extensions
 db.init_app(app)
 
+def _select_rate_limit_storage(url):
+    """Use the configured Redis for shared rate-limit counters, else in-process memory."""
+    if get_redis_client(url) is not None:
+        return url
+    return "memory://"
+
 limiter = Limiter(
     key_func=get_remote_address,
     default_limits=["200/day", "50/hour"],
+    storage_uri=_select_rate_limit_storage(app.config.get('RATE_LIMIT_STORAGE_URL')),
+    # Fixed windows cost one pipelined INCR + EXPIRE per hit; a moving window
+    # keeps a list entry per request and evaluates a Lua script on each hit
+    strategy="fixed-window",
     app=app,
 )
 
+# Shared Redis connection (None when Redis isn't installed or reachable)
+redis_client = get_redis_client(app.config.get('REDIS_URL'))
+
+# Keep the login session server-side in Redis so the cookie only carries a
+# signed session id; without Redis Flask's signed cookie session is kept
+if redis_client is not None and FLASK_SESSION_AVAILABLE:
+    app.config.update(
+        SESSION_TYPE='redis',
+        SESSION_REDIS=redis_client,
+        SESSION_USE_SIGNER=True,
+        SESSION_PERMANENT=True,
+    )
+    Session(app)
+
+# Voice session state; shared through Redis when it is reachable so several
+# workers can serve the same users, per-process otherwise
+voice_sessions = create_voice_session_store(app.config.get('REDIS_URL'))
+# Signed per-browser copy of the same state, read before falling back to the store
+voice_cookie = VoiceSessionCookie(app.config['SECRET_KEY'])
+
+# Relay emits between workers through Redis pub/sub whenever Redis is up, so
+# room emits reach clients connected to any worker
+_SOCKETIO_MESSAGE_QUEUE = app.config['REDIS_URL'] if redis_client is not None else None
+
 # Enhanced SocketIO setup with better error handling
 try:
     socketio = SocketIO(
         app, 
         cors_allowed_origins="*", 
-        async_mode='threading',
+        async_mode=app.config.get('SOCKETIO_ASYNC_MODE', 'threading'),
+        message_queue=_SOCKETIO_MESSAGE_QUEUE,
+        serializer=app.config.get('SOCKETIO_SERIALIZER', 'default'),
+        json=SocketIOJSON,
         logger=False,
         engineio_logger=False,
         ping_timeout=60,
@@ -174,84 +359,317 @@ try:
     
 except Exception as e:
     clean_log(f"Failed to initialize SocketIO: {e}", 'ERROR')
-    socketio = None# Enhanced database logging function
-@safe_database_operation
-def log_to_database(user_id, level, message, conversation_id=None):
-    """Enhanced database logging with better error handling."""
+    socketio = None
+
+# Shared pool for blocking voice/audio calls, so concurrent start/stop requests
+# queue up behind a fixed number of workers instead of all hitting the audio
+# stack at once
+_blocking_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='voice-blk')
+_BLOCKING_TIMEOUT = 30  # seconds a request waits on one blocking call
+
+def _run_blocking(func, *args, **kwargs):
+    """Run a blocking voice/audio call off the request path and return its result.
+    
+    Voice startup opens audio devices and talks to ElevenLabs/the database
+    from C code the monkey-patching can't make cooperative, so under eventlet
+    it goes to tpool to keep the hub free; otherwise to the shared pool.
+    Green threads started inside tpool never run, so func must not start
+    threads or timers; callers start those after it returns.
+    
+    Raises FutureTimeoutError after _BLOCKING_TIMEOUT seconds; the call itself
+    can't be interrupted and finishes in the background.
+    """
+    name = getattr(func, '__qualname__', repr(func))
+    timeout_error = FutureTimeoutError(f"{name} timed out after {_BLOCKING_TIMEOUT}s")
+    if socketio is not None and socketio.async_mode == 'eventlet':
+        import eventlet
+        from eventlet import tpool
+        with eventlet.Timeout(_BLOCKING_TIMEOUT, timeout_error):
+            return tpool.execute(func, *args, **kwargs)
     try:
-        with app.app_context():
-            user_id_str = str(user_id) if isinstance(user_id, uuid.UUID) else user_id
-            new_log = Log(
-                user_id=user_id_str,
-                level=level,
-                message=message,
-                conversation_id=conversation_id,
-                source='app_backend_enhanced'
-            )
-            db.session.add(new_log)
+        return _blocking_executor.submit(func, *args, **kwargs).result(timeout=_BLOCKING_TIMEOUT)
+    except FutureTimeoutError:
+        raise timeout_error from None
+
+@app.errorhandler(FutureTimeoutError)
+def _blocking_timeout(e):
+    logger.error("Blocking call timed out: %s", e)
+    return jsonify({'success': False, 'error': str(e)}), 504
+
+# Database logging: handlers only enqueue rows; a single background thread
+# writes them in batches with one commit per batch
+_LOG_QUEUE_MAX = 10_000
+_log_q = queue.Queue(maxsize=_LOG_QUEUE_MAX)
+_LOG_BATCH_MAX = 200
+_LOG_BATCH_WINDOW = 0.25  # seconds to keep collecting after the first row
+_dropped_log_rows = 0
+
+def log_to_database(user_id, level, message, conversation_id=None, *, args=()):
+    """Queue a log row for the background database writer.
+    
+    Never blocks: if the writer has fallen _LOG_QUEUE_MAX rows behind, the
+    oldest queued row is dropped to make room. If args are given, message is
+    a %-format string and is only formatted on the writer thread.
+    """
+    global _dropped_log_rows
+    row = {
+        'user_id': user_id,
+        'level': level,
+        'message': message,
+        'conversation_id': conversation_id,
+        'source': 'app_backend_enhanced',
+        # Raw epoch seconds; turned into a datetime on the writer thread
+        'timestamp': time.time(),
+    }
+    if args:
+        row['args'] = args
+    while True:
+        try:
+            _log_q.put_nowait(row)
+            return
+        except queue.Full:
+            try:
+                _log_q.get_nowait()
+            except queue.Empty:
+                continue
+            _dropped_log_rows += 1
+            # Warn on the first drop and then once per 1000, not per row
+            if _dropped_log_rows % 1000 == 1:
+                logger.warning("Database log queue full, %d rows dropped so far", _dropped_log_rows)
+
+def _write_log_batch(batch):
+    """Insert a batch of queued log rows in a single transaction."""
+    for row in batch:
+        # Naive UTC, matching the column's datetime.utcnow default
+        row['timestamp'] = datetime.fromtimestamp(row['timestamp'], timezone.utc).replace(tzinfo=None)
+        args = row.pop('args', None)
+        if args:
+            row['message'] = row['message'] % args
+    with app.app_context():
+        try:
+            # Core executemany: no ORM mapper or unit-of-work for write-only rows
+            db.session.execute(Log.__table__.insert(), batch)
             db.session.commit()
-            logger.debug(f"Logged to database: {level} - {message}")
-    except Exception as e:
-        logger.error(f"Failed to log to database: {e}")
-        logger.error(traceback.format_exc())
+            logger.debug("Logged %d rows to database", len(batch))
+        except Exception:
+            logger.exception("Failed to log to database")
+            try:
+                db.session.rollback()
+            except Exception as rollback_e:
+                logger.error("Error during rollback: %s", rollback_e)
+
+def _drain_log_queue(batch):
+    """Move already-queued rows into batch without blocking."""
+    while len(batch) < _LOG_BATCH_MAX:
         try:
-            db.session.rollback()
-        except Exception as rollback_e:
-            logger.error(f"Error during rollback: {rollback_e}")
-
-# Enhanced before_request handler
-@app.before_request
-def before_request_func():
-    if not getattr(g, 'db_initialized', False):
+            batch.append(_log_q.get_nowait())
+        except queue.Empty:
+            break
+    return batch
+
+def _log_flusher():
+    """Collect rows for up to _LOG_BATCH_WINDOW seconds, then write them."""
+    while True:
+        batch = [_log_q.get()]
+        deadline = time.monotonic() + _LOG_BATCH_WINDOW
+        while len(batch) < _LOG_BATCH_MAX:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(_log_q.get(timeout=remaining))
+            except queue.Empty:
+                break
+        _write_log_batch(batch)
+
+def _flush_pending_logs():
+    """Write whatever is still queued when the process exits."""
+    while not _log_q.empty():
+        batch = _drain_log_queue([])
+        if batch:
+            _write_log_batch(batch)
+
+threading.Thread(target=_log_flusher, name='db-log-flusher', daemon=True).start()
+atexit.register(_flush_pending_logs)
+
+# One-time schema setup, done at import instead of inspecting on every request
+_db_ready = threading.Event()
+_db_ready_lock = threading.Lock()
+
+def ensure_schema():
+    """Create any missing tables once per process."""
+    if _db_ready.is_set():
+        return
+    with _db_ready_lock:
+        if _db_ready.is_set():
+            return
         with app.app_context():
-            from sqlalchemy import inspect
-            inspector = inspect(db.engine)
-            if not inspector.has_table("users"):
-                logger.info("Database tables not found. Creating them now...")
-                try:
-                    db.create_all()
-                    logger.info("✅ Database tables created successfully.")
-                except Exception as e:
-                    logger.error(f"❌ Failed to create database tables: {e}")
-            else:
-                logger.debug("Database tables already exist.")
-        g.db_initialized = True
+            try:
+                # create_all checks for each table first, so existing ones are left alone
+                db.create_all()
+                # ...including their indexes, so add any the model gained since
+                # the table was created (e.g. ix_logs_user_ts)
+                for index in Log.__table__.indexes:
+                    index.create(bind=db.engine, checkfirst=True)
+                logger.info("Database tables ready.")
+            except Exception:
+                logger.exception("Failed to create database tables")
+                return
+        _db_ready.set()
+
+ensure_schema()
 
 # Global VoiceAssistant instance
 voice_assistant = None
 
+# Voice-thread log lines are buffered and sent as one 'log_batch' event every
+# _VOICE_LOG_FLUSH_DELAY seconds, or as soon as _VOICE_LOG_BATCH_MAX are pending
+_VOICE_LOG_BATCH_MAX = 20
+_VOICE_LOG_FLUSH_DELAY = 0.05
+_voice_log_buf = []
+_voice_log_lock = threading.Lock()
+_voice_log_timer = None
+
+def _flush_voice_logs():
+    """Emit all buffered voice log lines in a single Socket.IO event."""
+    global _voice_log_timer
+    with _voice_log_lock:
+        batch = _voice_log_buf[:]
+        _voice_log_buf.clear()
+        if _voice_log_timer is not None:
+            _voice_log_timer.cancel()
+            _voice_log_timer = None
+    if not batch:
+        return
+    try:
+        socketio.emit('log_batch', batch)
+    except Exception:
+        logger.exception("Error in voice log callback")
+
 def on_voice_log(message, level):
     """Callback to send log messages from the voice thread to the frontend."""
-    try:
-        socketio.emit('log', {'message': message, 'level': level})
-    except Exception as e:
-        logger.error(f"Error in voice log callback: {e}")
-        logger.error(traceback.format_exc())
+    global _voice_log_timer
+    with _voice_log_lock:
+        # safe_emit only cleans top-level strings and dicts, not this list,
+        # so strip the message here the way it would have
+        message = message.encode('ascii', 'ignore').decode('ascii')
+        _voice_log_buf.append({'message': message, 'level': level})
+        flush_now = len(_voice_log_buf) >= _VOICE_LOG_BATCH_MAX
+        if not flush_now and _voice_log_timer is None:
+            _voice_log_timer = threading.Timer(_VOICE_LOG_FLUSH_DELAY, _flush_voice_logs)
+            _voice_log_timer.daemon = True
+            _voice_log_timer.start()
+    if flush_now:
+        _flush_voice_logs()
 
 def on_voice_status_change(status):
     """Callback to send status updates from the voice thread to the frontend."""
     try:
         socketio.emit('status_update', {'status': status})
-    except Exception as e:
-        logger.error(f"Error in status change callback: {e}")
-        logger.error(traceback.format_exc())
+    except Exception:
+        logger.exception("Error in status change callback")
         
+_voice_init_lock = threading.Lock()
+
 def init_voice_assistant():
-    """Initializes the global VoiceAssistant instance with better error handling."""
+    """Create the global VoiceAssistant on first use; later calls return at once.
+    
+    Unlike functools.cache this doesn't memoize a failed attempt, so a later
+    request can still retry initialization.
+    """
     global voice_assistant
+    if voice_assistant is not None:
+        return True
     
-    try:
-        if voice_assistant is None:
+    with _voice_init_lock:
+        if voice_assistant is not None:
+            return True
+        try:
             clean_log("Initializing voice assistant...")
             voice_assistant = VoiceAssistant(app, on_voice_status_change, on_voice_log, log_to_database)
             clean_log("Voice assistant initialized successfully")
             return True
-        else:
-            clean_log("Voice assistant already initialized")
-            return True
+        except Exception as e:
+            clean_log(f"Failed to initialize voice assistant: {str(e)}", 'ERROR')
+            return False
+
+# Built once at import so request handlers never initialize it lazily
+init_voice_assistant()
+
+# Last calendar connectivity result, reused by /health for a few seconds so
+# frequent probes don't each make a Google Calendar round-trip
+_CALENDAR_HEALTH_TTL = 15
+_calendar_health = {'checked_at': float('-inf'), 'ok': False}
+
+# Calendar reads cached in Redis so every worker shares one Google API call
+# per key and TTL; without Redis they go straight to the API
+_CALENDAR_CONN_TTL = 45
+_CALENDAR_TODAY_TTL = 30
+_CALENDAR_UPCOMING_TTL = 60
+_CALENDAR_NEXT_TTL = 30
+_CALENDAR_FREE_TTL = 60
+_CALENDAR_CACHE_PREFIX = 'cal:'
+_CALENDAR_FIXED_KEYS = tuple(f"{_CALENDAR_CACHE_PREFIX}{name}" for name in ('today', 'next', 'free'))
+# Set of the cal:up:<days> keys currently cached, so invalidation never SCANs
+_CALENDAR_UPCOMING_KEYS = f"{_CALENDAR_CACHE_PREFIX}up:keys"
+
+def _calendar_fetch_ok(result):
+    # The calendar helpers report failures as an "Unable to ..." string
+    return not (isinstance(result, str) and result.startswith(('Unable to fetch', 'Unable to calculate')))
+
+def _cached_result(key, ttl, producer, cacheable=lambda result: True, track=None):
+    """Return producer()'s JSON-serializable result, cached in Redis for ttl seconds.
+    
+    If track is given, key is also added to that Redis set when it is written.
+    """
+    if redis_client is None:
+        return producer()
+    try:
+        raw = redis_client.get(key)
+        if raw is not None:
+            return orjson.loads(raw)
     except Exception as e:
-        clean_log(f"Failed to initialize voice assistant: {str(e)}", 'ERROR')
-        return False
+        logger.warning("Redis cache read failed for %s: %s", key, e)
+    result = producer()
+    if cacheable(result):
+        try:
+            if track is None:
+                redis_client.setex(key, ttl, orjson.dumps(result))
+            else:
+                pipe = redis_client.pipeline()
+                pipe.setex(key, ttl, orjson.dumps(result))
+                pipe.sadd(track, key)
+                pipe.expire(track, ttl)
+                pipe.execute()
+        except Exception as e:
+            logger.warning("Redis cache write failed for %s: %s", key, e)
+    return result
+
+# Serialized user profiles for /api/auth/me and /api/auth/session; refreshed
+# on login (last_login changes) and dropped on password change
+_USER_DICT_TTL = 600
+
+def _user_dict(user):
+    """Return user.to_dict(), served from Redis when a cached copy exists."""
+    return _cached_result(f"udict:{user.id}", _USER_DICT_TTL, user.to_dict)
+
+def _forget_user_dict(user_id):
+    if redis_client is None:
+        return
+    try:
+        redis_client.delete(f"udict:{user_id}")
+    except Exception as e:
+        logger.warning("Failed to drop cached user %s: %s", user_id, e)
+
+def _invalidate_calendar_cache():
+    """Drop cached schedules after this app changes the calendar."""
+    if redis_client is None:
+        return
+    try:
+        upcoming = redis_client.smembers(_CALENDAR_UPCOMING_KEYS)
+        redis_client.delete(*_CALENDAR_FIXED_KEYS, *upcoming, _CALENDAR_UPCOMING_KEYS)
+    except Exception as e:
+        logger.warning("Failed to invalidate calendar cache: %s", e)
 
 # --- ROUTES ---
 @app.route('/health', methods=['GET'])
@@ -262,27 +680,33 @@ def health_check():
         user_info = None
         if hasattr(request, 'current_user') and request.current_user:
             user_info = {
-                'id': str(request.current_user.id),
+                'id': request.current_user.id,
                 'username': request.current_user.username,
                 'authenticated': True
             }
         else:
             user_info = {'authenticated': False}
 
-        calendar_ok = test_calendar_connection()
+        now = time.monotonic()
+        if now - _calendar_health['checked_at'] > _CALENDAR_HEALTH_TTL:
+            _calendar_health['ok'] = _cached_result(
+                'calendar:conn_ok', _CALENDAR_CONN_TTL, test_calendar_connection
+            )
+            _calendar_health['checked_at'] = now
+        calendar_ok = _calendar_health['ok']
 
         return jsonify({
             'status': 'healthy',
-            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'timestamp': _fast_utcnow_iso(),
             'user': user_info,
             'database': 'connected',
             'calendar_connected': calendar_ok,
+            'active_voice_sessions': voice_sessions.active_count(),
             'config_env': os.getenv('FLASK_ENV', 'development'),
         }), 200
 
     except Exception as e:
-        logger.error(f"Health check error: {str(e)}")
-        logger.error(traceback.format_exc())
+        logger.exception("Health check error")
         return jsonify({
             'status': 'error',
             'error': str(e)
@@ -293,20 +717,15 @@ def health_check():
 def register():
     """User registration endpoint"""
     try:
-        data = request.get_json()
-        if not data:
-            return jsonify({'error': 'No data provided'}), 400
-        username = data.get('username', '').strip()
-        email = data.get('email', '').strip()
-        password = data.get('password', '')
-        first_name = data.get('first_name', '').strip()
-        last_name = data.get('last_name', '').strip()
+        data, error = parse_request(RegisterRequest)
+        if error:
+            return jsonify({'error': error_message(error)}), 400
         success, result = AuthService.register_user(
-            username=username,
-            email=email,
-            password=password,
-            first_name=first_name if first_name else None,
-            last_name=last_name if last_name else None
+            username=data.username,
+            email=data.email,
+            password=data.password,
+            first_name=data.first_name or None,
+            last_name=data.last_name or None
         )
         if not success:
             return jsonify({'error': result}), 400
@@ -315,8 +734,8 @@ def register():
             'message': 'Registration successful',
             'user': user.to_dict()
         }), 201
-    except Exception as e:
-        logger.error(f"Registration endpoint error: {str(e)}")
+    except Exception:
+        logger.exception("Registration endpoint error")
         return jsonify({'error': 'Registration failed'}), 500
 
 @app.route('/api/auth/login', methods=['POST'])
@@ -324,14 +743,10 @@ def register():
 def login():
     """User login endpoint"""
     try:
-        data = request.get_json()
-        if not data:
-            return jsonify({'error': 'No data provided'}), 400
-        username_or_email = data.get('username', '').strip()
-        password = data.get('password', '')
-        if not username_or_email or not password:
-            return jsonify({'error': 'Username/email and password required'}), 400
-        success, result = AuthService.authenticate_user(username_or_email, password)
+        data, error = parse_request(LoginRequest)
+        if error:
+            return jsonify({'error': error_message(error)}), 400
+        success, result = AuthService.authenticate_user(data.username, data.password)
         if not success:
             return jsonify({'error': result}), 401
         user = result
@@ -345,13 +760,14 @@ def login():
         session['session_token'] = session_obj.session_token
         session['user_id'] = str(user.id)
         session.permanent = True
+        _forget_user_dict(user.id)
         return jsonify({
             'message': 'Login successful',
-            'user': user.to_dict(),
+            'user': _user_dict(user),
             'session_token': session_obj.session_token
         }), 200
-    except Exception as e:
-        logger.error(f"Login endpoint error: {str(e)}")
+    except Exception:
+        logger.exception("Login endpoint error")
         return jsonify({'error': 'Login failed'}), 500
 
 @app.route('/api/auth/logout', methods=['POST'])
@@ -364,8 +780,8 @@ def logout():
             AuthService.logout_user(session_token)
         session.clear()
         return jsonify({'message': 'Logout successful'}), 200
-    except Exception as e:
-        logger.error(f"Logout endpoint error: {str(e)}")
+    except Exception:
+        logger.exception("Logout endpoint error")
         return jsonify({'error': 'Logout failed'}), 500
 
 @app.route('/api/auth/me', methods=['GET'])
@@ -374,12 +790,14 @@ def get_current_user():
     """Get current user info"""
     try:
         return jsonify({
-            'user': request.current_user.to_dict()
+            'user': _user_dict(request.current_user)
         }), 200
-    except Exception as e:
-        logger.error(f"Get current user error: {str(e)}")
+    except Exception:
+        logger.exception("Get current user error")
         return jsonify({'error': 'Failed to get user info'}), 500
 
+_ANONYMOUS_SESSION_BODY = orjson.dumps({'success': True, 'data': {'authenticated': False, 'user': None}})
+
 @app.route('/api/auth/session', methods=['GET'])
 @optional_auth
 def get_session_info():
@@ -389,78 +807,119 @@ def get_session_info():
             'success': True,
             'data': {
                 'authenticated': True,
-                'user': request.current_user.to_dict()
+                'user': _user_dict(request.current_user)
             }
         }), 200
     else:
-        return jsonify({
-            'success': True,
-            'data': {
-                'authenticated': False,
-                'user': None
-            }
-        }), 200
+        return Response(_ANONYMOUS_SESSION_BODY, status=200, mimetype='application/json')
 
 @app.route('/api/auth/change-password', methods=['POST'])
 @require_auth
 def change_password():
     """Change user password"""
     try:
-        data = request.get_json()
-        current_password = data.get('current_password', '')
-        new_password = data.get('new_password', '')
-        if not current_password or not new_password:
-            return jsonify({'error': 'Current and new passwords required'}), 400
+        data, error = parse_request(ChangePasswordRequest)
+        if error:
+            return jsonify({'error': error_message(error)}), 400
         user = request.current_user
-        if not user.check_password(current_password):
+        if not user.check_password(data.current_password):
             return jsonify({'error': 'Current password is incorrect'}), 400
-        password_errors = AuthService.validate_password(new_password)
+        password_errors = AuthService.validate_password(data.new_password)
         if password_errors:
             return jsonify({'error': '; '.join(password_errors)}), 400
-        user.set_password(new_password)
+        user.set_password(data.new_password)
         db.session.commit()
+        AuthService.forget_cached_user(user.id)
+        _forget_user_dict(user.id)
         return jsonify({'message': 'Password changed successfully'}), 200
-    except Exception as e:
-        logger.error(f"Change password error: {str(e)}")
+    except Exception:
+        logger.exception("Change password error")
         return jsonify({'error': 'Failed to change password'}), 500
 
+# The root response never changes, so it is encoded once at import
+_INDEX_BODY = orjson.dumps({
+    'success': True,
+    'data': {
+        'service': 'Voice Assistant Backend',
+        'version': '1.0.1',
+        'status': 'running',
+        'user': 'Chirag Gupta',
+        'endpoints': {
+            'health': '/health',
+            'calendar': '/api/calendar/*',
+            'voice': '/api/voice/*',
+            'auth': '/api/auth/*',
+            'logs': '/api/logs',
+            'test_page': '/static/index.html'
+        }
+    },
+    'message': "🎙️ Voice Assistant Backend API is running!"
+})
+
 @app.route('/')
 def index():
     """API root endpoint"""
-    return jsonify(
-        success=True,
-        data={
-            'service': 'Voice Assistant Backend',
-            'version': '1.0.1',
-            'status': 'running',
-            'user': 'Chirag Gupta',
-            'endpoints': {
-                'health': '/health',
-                'calendar': '/api/calendar/*',
-                'voice': '/api/voice/*',
-                'auth': '/api/auth/*',
-                'logs': '/api/logs',
-                'test_page': '/static/index.html'
-            }
-        },
-        message="🎙️ Voice Assistant Backend API is running!"
-    )
+    return Response(_INDEX_BODY, mimetype='application/json')
 
 @app.route('/api/logs', methods=['GET'])
 @require_auth
 def get_logs():
-    """Get paginated logs for the current user"""
+    """Get the current user's logs, newest first, using keyset pagination.
+    
+    Pass the previous response's next_cursor back as ?before=<timestamp>&before_id=<id>
+    to fetch the next page. Requests with ?page= get the older offset pages
+    (page/per_page in, total/page/pages out) for existing clients.
+    """
     user_id = request.current_user.id
-    page = request.args.get('page', 1, type=int)
-    per_page = request.args.get('per_page', 20, type=int)
-    logs = Log.query.filter_by(user_id=user_id).order_by(Log.timestamp.desc()).paginate(page=page, per_page=per_page, error_out=False)
+    if 'page' in request.args:
+        page = request.args.get('page', 1, type=int)
+        per_page = request.args.get('per_page', 20, type=int)
+        logs = Log.query.filter_by(user_id=user_id).order_by(
+            Log.timestamp.desc(), Log.id.desc()
+        ).paginate(page=page, per_page=per_page, error_out=False)
+        return jsonify(
+            success=True,
+            data={
+                'logs': [log.to_dict() for log in logs.items],
+                'total': logs.total,
+                'page': logs.page,
+                'pages': logs.pages
+            }
+        )
+    
+    limit = min(max(request.args.get('limit', 20, type=int), 1), 100)
+    before = request.args.get('before')
+    before_id = request.args.get('before_id', type=int)
+    
+    # Plain column rows: no ORM instances or identity-map bookkeeping per log
+    query = db.session.query(*Log.COLUMNS).filter(Log.user_id == user_id)
+    if before:
+        try:
+            before_ts = datetime.fromisoformat(before)
+        except ValueError:
+            return jsonify(success=False, error="Invalid 'before' timestamp"), 400
+        if before_id is not None:
+            query = query.filter(or_(
+                Log.timestamp < before_ts,
+                and_(Log.timestamp == before_ts, Log.id < before_id)
+            ))
+        else:
+            query = query.filter(Log.timestamp < before_ts)
+    
+    rows = query.order_by(Log.timestamp.desc(), Log.id.desc()).limit(limit + 1).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    next_cursor = None
+    if has_more:
+        last = rows[-1]
+        next_cursor = {'before': last.timestamp, 'before_id': last.id}
+    
     return jsonify(
         success=True,
         data={
-            'logs': [log.to_dict() for log in logs.items],
-            'total': logs.total,
-            'page': logs.page,
-            'pages': logs.pages
+            'logs': [Log.row_to_dict(row) for row in rows],
+            'next_cursor': next_cursor,
+            'has_more': has_more
         }
     )
 
@@ -479,7 +938,10 @@ def api_get_next_meeting():
         if user_id:
             log_to_database(user_id, 'INFO', "Requested next meeting")
         
-        next_meeting = get_next_meeting()
+        next_meeting = _cached_result(
+            f"{_CALENDAR_CACHE_PREFIX}next", _CALENDAR_NEXT_TTL,
+            get_next_meeting, cacheable=_calendar_fetch_ok
+        )
         
         if user_id:
             log_to_database(user_id, 'INFO', f"Successfully retrieved next meeting: {next_meeting}")
@@ -490,8 +952,7 @@ def api_get_next_meeting():
             message="Next meeting retrieved successfully"
         )
     except Exception as e:
-        logger.error(f"Error getting next meeting: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception("Error getting next meeting")
         if user_id:
             log_to_database(user_id, 'ERROR', f"Failed to retrieve next meeting: {str(e)}")
         return jsonify(success=False, error=str(e)), 500
@@ -511,7 +972,10 @@ def api_get_free_time():
         if user_id:
             log_to_database(user_id, 'INFO', "Requested free time slots")
         
-        free_time = get_free_time_today()
+        free_time = _cached_result(
+            f"{_CALENDAR_CACHE_PREFIX}free", _CALENDAR_FREE_TTL,
+            get_free_time_today, cacheable=_calendar_fetch_ok
+        )
         
         if user_id:
             log_to_database(user_id, 'INFO', f"Successfully retrieved free time: {free_time}")
@@ -522,8 +986,7 @@ def api_get_free_time():
             message="Free time slots retrieved successfully"
         )
     except Exception as e:
-        logger.error(f"Error getting free time: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception("Error getting free time")
         if user_id:
             log_to_database(user_id, 'ERROR', f"Failed to retrieve free time: {str(e)}")
         return jsonify(success=False, error=str(e)), 500
@@ -537,7 +1000,10 @@ def api_get_today_schedule():
     try:
         logger.info(f"User {user_id} requested today's schedule")
         log_to_database(user_id, 'INFO', "Requested today's schedule")
-        schedule = get_today_schedule()
+        schedule = _cached_result(
+            f"{_CALENDAR_CACHE_PREFIX}today", _CALENDAR_TODAY_TTL,
+            get_today_schedule, cacheable=_calendar_fetch_ok
+        )
         log_to_database(user_id, 'INFO', f"Successfully retrieved today's schedule: {len(schedule) if isinstance(schedule, list) else 'schedule data'} events")
         return jsonify(
             success=True,
@@ -545,8 +1011,7 @@ def api_get_today_schedule():
             message="Today's schedule retrieved successfully"
         )
     except Exception as e:
-        logger.error(f"Error getting today's schedule: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception("Error getting today's schedule")
         log_to_database(user_id, 'ERROR', f"Failed to retrieve today's schedule: {str(e)}")
         return jsonify(success=False, error=str(e)), 500
 
@@ -568,7 +1033,11 @@ def api_get_upcoming_events():
         logger.info(f"User {user_id} requested upcoming events for {days} days")
         log_to_database(user_id, 'INFO', f"Requested upcoming events for {days} days")
         
-        events = get_upcoming_events(days)
+        events = _cached_result(
+            f"{_CALENDAR_CACHE_PREFIX}up:{days}", _CALENDAR_UPCOMING_TTL,
+            lambda: get_upcoming_events(days), cacheable=_calendar_fetch_ok,
+            track=_CALENDAR_UPCOMING_KEYS
+        )
         
         log_to_database(user_id, 'INFO', f"Successfully retrieved {len(events) if isinstance(events, list) else 'upcoming'} events for {days} days")
         
@@ -578,8 +1047,7 @@ def api_get_upcoming_events():
             message=f"Upcoming events for {days} days retrieved successfully"
         )
     except Exception as e:
-        logger.error(f"Error getting upcoming events: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception("Error getting upcoming events")
         log_to_database(user_id, 'ERROR', f"Failed to retrieve upcoming events: {str(e)}")
         return jsonify(
             success=False,
@@ -595,24 +1063,24 @@ def api_reschedule_event(event_id):
     if not request.is_json:
         return jsonify(success=False, error="Request must be JSON"), 400
     
-    data = request.json
-    new_start_time = data.get('new_start_time')
-    if not new_start_time:
-        return jsonify(success=False, error="new_start_time is required"), 400
+    data, error = parse_request(RescheduleEventRequest)
+    if error:
+        return jsonify(success=False, error=error_message(error)), 400
+    new_start_time = data.new_start_time
         
     try:
         logger.info(f"User {user_id} rescheduling event {event_id} to {new_start_time}")
         log_to_database(user_id, 'INFO', f"Rescheduling event {event_id}")
         
         result = reschedule_event(event_id, new_start_time)
+        _invalidate_calendar_cache()
         
         log_to_database(user_id, 'INFO', f"Event {event_id} rescheduled. Result: {result}")
-        socketio.emit('calendar_update', {'type': 'event_rescheduled', 'event_id': event_id, 'result': result}, room=f"user_{str(user_id)}")
+        _emit_to_room('calendar_update', {'type': 'event_rescheduled', 'event_id': event_id, 'result': result}, _current_room(), defer=True)
         
         return jsonify(success=True, data={'result': result}, message="Event rescheduled successfully")
     except Exception as e:
-        logger.error(f"Error rescheduling event {event_id}: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception("Error rescheduling event %s", event_id)
         log_to_database(user_id, 'ERROR', f"Failed to reschedule event {event_id}: {str(e)}")
         return jsonify(success=False, error=str(e)), 500
 
@@ -627,14 +1095,14 @@ def api_cancel_event(event_id):
         log_to_database(user_id, 'INFO', f"Canceling event {event_id}")
         
         result = cancel_event(event_id)
+        _invalidate_calendar_cache()
         
         log_to_database(user_id, 'INFO', f"Event {event_id} canceled. Result: {result}")
-        socketio.emit('calendar_update', {'type': 'event_canceled', 'event_id': event_id, 'result': result}, room=f"user_{str(user_id)}")
+        _emit_to_room('calendar_update', {'type': 'event_canceled', 'event_id': event_id, 'result': result}, _current_room(), defer=True)
         
         return jsonify(success=True, data={'result': result}, message="Event canceled successfully")
     except Exception as e:
-        logger.error(f"Error canceling event {event_id}: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception("Error canceling event %s", event_id)
         log_to_database(user_id, 'ERROR', f"Failed to cancel event {event_id}: {str(e)}")
         return jsonify(success=False, error=str(e)), 500
 
@@ -658,8 +1126,7 @@ def api_find_meeting_slots():
         
         return jsonify(success=True, data={'slots': slots}, message="Meeting slots retrieved successfully")
     except Exception as e:
-        logger.error(f"Error finding meeting slots: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception("Error finding meeting slots")
         log_to_database(user_id, 'ERROR', f"Failed to find meeting slots: {str(e)}")
         return jsonify(success=False, error=str(e)), 500
 
@@ -672,10 +1139,10 @@ def api_set_event_reminder(event_id):
     if not request.is_json:
         return jsonify(success=False, error="Request must be JSON"), 400
         
-    data = request.json
-    minutes_before = data.get('minutes_before')
-    if not isinstance(minutes_before, int) or minutes_before <= 0:
-        return jsonify(success=False, error="minutes_before must be a positive integer"), 400
+    data, error = parse_request(EventReminderRequest)
+    if error:
+        return jsonify(success=False, error=error_message(error)), 400
+    minutes_before = data.minutes_before
 
     try:
         logger.info(f"User {user_id} setting reminder for event {event_id}, {minutes_before} minutes before.")
@@ -687,12 +1154,16 @@ def api_set_event_reminder(event_id):
         
         return jsonify(success=True, data={'result': result}, message="Reminder set successfully")
     except Exception as e:
-        logger.error(f"Error setting reminder for event {event_id}: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception("Error setting reminder for event %s", event_id)
         log_to_database(user_id, 'ERROR', f"Failed to set reminder for event {event_id}: {str(e)}")
         return jsonify(success=False, error=str(e)), 500
 
 # Voice assistant API endpoints
+_VOICE_INACTIVE_BODY = orjson.dumps({
+    'success': True,
+    'data': {'active': False, 'status': 'inactive', 'user_id': None, 'is_listening': False}
+})
+
 @app.route('/api/voice/status', methods=['GET'])
 @optional_auth
 def api_voice_status():
@@ -700,9 +1171,18 @@ def api_voice_status():
     user_id = request.current_user.id if hasattr(request, 'current_user') and request.current_user else None
     
     if not voice_assistant:
-        return jsonify({'success': True, 'data': {'active': False, 'status': 'inactive', 'user_id': None, 'is_listening': False}})
+        return Response(_VOICE_INACTIVE_BODY, mimetype='application/json')
     
     status_data = voice_assistant.get_status()
+    # Session times are stored as raw ns and only formatted when reported
+    voice_session = None
+    if user_id:
+        # The store is authoritative (a stop from another client or worker
+        # lands there); the cookie only fills in when it has no entry
+        voice_session = voice_sessions.get(_current_uid_str()) or voice_cookie.load(request, _current_uid_str())
+    if voice_session:
+        status_data['started_at'] = _fmt_ns(voice_session.get('started_at_ns'))
+        status_data['stopped_at'] = _fmt_ns(voice_session.get('stopped_at_ns'))
     
     return jsonify({'success': True, 'data': status_data})
 
@@ -715,41 +1195,33 @@ def api_start_voice():
     user_id = user.id
     
     # Always reinitialize voice assistant if it's None
-    global voice_assistant
-    if not voice_assistant:
-        init_voice_assistant()
-        if not voice_assistant:
-            return jsonify({'success': False, 'error': 'Failed to initialize voice assistant'}), 500
+    if voice_assistant is None:
+        return jsonify({'success': False, 'error': 'Voice assistant unavailable'}), 503
 
     # Check if already listening for this user
     if voice_assistant.is_listening and voice_assistant.user_id == user_id:
         # Already listening for this user, just confirm success
-        voice_sessions[str(user_id)] = {
-            'active': True,
-            'started_at': datetime.now(timezone.utc).isoformat(),
-            'user_id': user_id
-        }
-        return jsonify({'success': True, 'message': 'Voice assistant already active'})
+        session_data = {'active': True, 'started_at_ns': time.time_ns()}
+        voice_sessions.set(_current_uid_str(), session_data)
+        response = jsonify({'success': True, 'message': 'Voice assistant already active'})
+        return voice_cookie.save(response, _current_uid_str(), session_data)
     
     # If listening for different user, stop first
     if voice_assistant.is_listening:
-        logger.info(f"Switching voice assistant from user {voice_assistant.user_id} to user {user_id}")
+        logger.info("Switching voice assistant from user %s to user %s", voice_assistant.user_id, user_id)
         voice_assistant.stop_listening()
-        time.sleep(1)  # Brief pause to allow cleanup
+        voice_assistant.wait_stopped(timeout=1)  # Until the old session has cleaned up
     
     # Start listening for this user
-    success, message = voice_assistant.start_listening(user_id)
+    success, message = voice_assistant.start_listening(user_id, run_blocking=_run_blocking)
     
     if success:
-        voice_sessions[str(user_id)] = {
-            'active': True,
-            'started_at': datetime.now(timezone.utc).isoformat(),
-            'user_id': user_id
-        }
-        logger.info(f"Voice assistant started successfully for user {user_id}")
-        return jsonify({'success': True, 'message': message})
+        session_data = {'active': True, 'started_at_ns': time.time_ns()}
+        voice_sessions.set(_current_uid_str(), session_data)
+        logger.info("Voice assistant started successfully for user %s", user_id)
+        return voice_cookie.save(jsonify({'success': True, 'message': message}), _current_uid_str(), session_data)
     else:
-        logger.error(f"Failed to start voice assistant for user {user_id}: {message}")
+        logger.error("Failed to start voice assistant for user %s: %s", user_id, message)
         return jsonify({'success': False, 'error': message}), 500
 
 @app.route('/api/voice/stop', methods=['POST'])
@@ -757,19 +1229,18 @@ def api_start_voice():
 @require_auth
 def api_stop_voice():
     """Stop voice assistant"""
-    user_id = request.current_user.id
-    
     if not voice_assistant or not voice_assistant.is_listening:
         return jsonify({'success': False, 'error': "Voice assistant is not active for this user."}), 400
     
     success, message = voice_assistant.stop_listening()
     
     if success:
-        # FIX: Update voice_sessions instead of app.state
-        if str(user_id) in voice_sessions:
-            voice_sessions[str(user_id)]['active'] = False
-            voice_sessions[str(user_id)]['stopped_at'] = datetime.now(timezone.utc).isoformat()
-        return jsonify({'success': True, 'message': message})
+        stopped_at_ns = time.time_ns()
+        voice_sessions.update(_current_uid_str(), active=False, stopped_at_ns=stopped_at_ns)
+        response = jsonify({'success': True, 'message': message})
+        session_data = voice_cookie.load(request, _current_uid_str()) or {}
+        session_data.update(active=False, stopped_at_ns=stopped_at_ns)
+        return voice_cookie.save(response, _current_uid_str(), session_data)
     else:
         return jsonify({'success': False, 'error': message}), 500
 
@@ -781,12 +1252,13 @@ def api_send_transcript():
     if not voice_assistant or not voice_assistant.is_listening or not user_id:
         return jsonify({'success': False, 'error': "Voice assistant is not active or user is not authenticated"}), 400
 
-    data = request.json
-    transcript = data.get('transcript', '').strip()
-    if not transcript:
-        return jsonify({'success': False, 'error': 'Transcript is required'}), 400
+    data, error = parse_request(TranscriptRequest)
+    if error:
+        return jsonify({'success': False, 'error': error_message(error)}), 400
+    transcript = data.transcript
 
-    voice_assistant.user_transcript_queue.put(transcript)
+    if not voice_assistant.submit_transcript(transcript):
+        return jsonify({'success': False, 'error': 'Voice assistant is busy, try again shortly'}), 503
 
     return jsonify({'success': True, 'message': 'Transcript received and queued for processing'})
 
@@ -801,118 +1273,105 @@ def api_voice_input():
     if not request.is_json:
         return jsonify({'success': False, 'error': "Request must be JSON"}), 400
     
-    data = request.json
-    text_input = data.get('text', '').strip()
-    
-    if not text_input:
-        return jsonify({'success': False, 'error': "text is required"}), 400
+    data, error = parse_request(VoiceInputRequest)
+    if error:
+        return jsonify({'success': False, 'error': error_message(error)}), 400
+    text_input = data.text
     
     # Initialize voice assistant if needed
-    global voice_assistant
-    if not voice_assistant:
-        init_voice_assistant()
-        if not voice_assistant:
-            return jsonify({'success': False, 'error': 'Failed to initialize voice assistant'}), 500
+    if voice_assistant is None:
+        return jsonify({'success': False, 'error': 'Voice assistant unavailable'}), 503
         
-    # More flexible session handling - auto-create session if needed
-    if str(user_id) not in voice_sessions:
-        voice_sessions[str(user_id)] = {
-            'active': True,
-            'started_at': datetime.now(timezone.utc).isoformat(),
-            'user_id': user_id
-        }
+    # More flexible session handling - auto-create session if needed.
+    # An active cookie is only a hint for the start time; the store entry
+    # is recreated whenever it is missing (e.g. after it expired).
+    session_data = voice_cookie.load(request, _current_uid_str())
+    if not (session_data and session_data['active']):
+        session_data = {'active': True, 'started_at_ns': time.time_ns()}
+    voice_sessions.set_default(_current_uid_str(), session_data)
     
     # Auto-start the voice assistant if not listening for this user
     if not voice_assistant.is_listening or voice_assistant.user_id != user_id:
-        logger.info(f"Auto-starting voice assistant for user {user_id}")
+        logger.info("Auto-starting voice assistant for user %s", user_id)
         
         # If listening for different user, stop first
         if voice_assistant.is_listening:
             voice_assistant.stop_listening()
-            time.sleep(0.5)  # Brief pause to allow cleanup
+            voice_assistant.wait_stopped(timeout=0.5)  # Until the old session has cleaned up
         
-        success, message = voice_assistant.start_listening(user_id)
+        success, message = voice_assistant.start_listening(user_id, run_blocking=_run_blocking)
         if not success:
             return jsonify({'success': False, 'error': f"Failed to start voice assistant: {message}"}), 500
         
-        # Update session status
-        voice_sessions[str(user_id)]['active'] = True
+        # This path started the session, so record it in the store
+        session_data = {'active': True, 'started_at_ns': time.time_ns()}
+        voice_sessions.set(_current_uid_str(), session_data)
     
     try:
-        logger.info(f"Processing voice input from user {user_id}: {text_input}")
-        log_to_database(user_id, 'INFO', f"Voice input received: {text_input}")
+        logger.info("Processing voice input from user %s: %s", user_id, text_input)
+        log_to_database(user_id, 'INFO', "Voice input received: %s", args=(text_input,))
         
         # Use the existing voice assistant's queue system
-        voice_assistant.user_transcript_queue.put(text_input)
+        if not voice_assistant.submit_transcript(text_input):
+            return jsonify({'success': False, 'error': 'Voice assistant is busy, try again shortly'}), 503
         
-        log_to_database(user_id, 'INFO', f"Voice input queued for processing")
+        log_to_database(user_id, 'INFO', "Voice input queued for processing")
         
         # Emit to the user's room for real-time updates
-        try:
-            socketio.emit('voice_response', {
-                'input': text_input,
-                'status': 'queued',
-                'timestamp': datetime.now(timezone.utc).isoformat()
-            }, room=f"user_{str(user_id)}")
-        except Exception as e:
-            logger.error(f"Socket.IO emit error: {str(e)}")
-            # Fall back to non-room broadcast if room-specific emit fails
-            socketio.emit('voice_response', {
-                'input': text_input,
-                'status': 'queued',
-                'timestamp': datetime.now(timezone.utc).isoformat()
-            })
+        # One payload dict feeds both the emit and the HTTP response
+        payload = {
+            'input': text_input,
+            'status': 'queued',
+            'timestamp': _fast_utcnow_iso()
+        }
+        _emit_to_room('voice_response', payload, _current_room())
         
-        return jsonify({
+        response = jsonify({
             'success': True,
-            'data': {
-                'input': text_input,
-                'status': 'queued',
-                'voice_assistant_status': 'listening'
-            },
+            'data': {**payload, 'voice_assistant_status': 'listening'},
             'message': "Voice input queued successfully"
         })
+        return voice_cookie.save(response, _current_uid_str(), session_data)
         
     except Exception as e:
-        logger.error(f"Error processing voice input: {e}")
-        logger.error(traceback.format_exc())
-        log_to_database(user_id, 'ERROR', f"Failed to process voice input: {str(e)}")
+        logger.exception("Error processing voice input")
+        log_to_database(user_id, 'ERROR', "Failed to process voice input: %s", args=(e,))
         return jsonify({'success': False, 'error': str(e)}), 500
 
+def _on_microphone_text(text):
+    """Hand recognized speech to the voice assistant and echo it to its user's room."""
+    if not (voice_assistant and voice_assistant.is_listening):
+        return
+    logger.info("Microphone recognized: %s", text)
+    if not voice_assistant.submit_transcript(text):
+        logger.warning("Dropping microphone transcript, voice assistant backlog is full")
+        return
+    
+    # Emit to frontend for real-time updates
+    room = f"user_{voice_assistant.user_id}"
+    if _room_has_clients(room):
+        socketio.emit('voice_input', {
+            'text': text,
+            'source': 'microphone',
+            'timestamp': _fast_utcnow_iso()
+        }, room=room)
+
 @app.route('/api/voice/start-microphone', methods=['POST'])
 @require_auth
 def start_microphone():
     """Start microphone listening"""
-    global microphone_handler, voice_assistant
+    global microphone_handler
     
     try:
         user_id = request.current_user.id
         
-        # Initialize voice assistant if needed
-        if not voice_assistant:
-            init_voice_assistant()
-            if not voice_assistant:
-                return jsonify({'success': False, 'error': 'Failed to initialize voice assistant'}), 500
+        if voice_assistant is None:
+            return jsonify({'success': False, 'error': 'Voice assistant unavailable'}), 503
         
-        # Initialize microphone handler if not exists
         if not microphone_handler:
-            def voice_callback(text):
-                # Send recognized text to voice assistant
-                if voice_assistant and voice_assistant.is_listening:
-                    logger.info(f"Microphone recognized: {text}")
-                    voice_assistant.user_transcript_queue.put(text)
-                    
-                    # Emit to frontend for real-time updates
-                    try:
-                        socketio.emit('voice_input', {
-                            'text': text,
-                            'source': 'microphone',
-                            'timestamp': datetime.now(timezone.utc).isoformat()
-                        }, room=f"user_{str(user_id)}")
-                    except Exception as e:
-                        logger.error(f"Socket.IO emit error: {e}")
-            
-            microphone_handler = MicrophoneHandler(callback=voice_callback)
+            # Opening the device is the blocking part; the listen thread is
+            # started below from this thread
+            microphone_handler = _run_blocking(MicrophoneHandler, callback=_on_microphone_text)
         
         # Start listening
         success = microphone_handler.start_listening()
@@ -923,16 +1382,16 @@ def start_microphone():
         else:
             return jsonify({'success': False, 'error': 'Failed to start microphone'})
             
+    except FutureTimeoutError:
+        raise  # Answered as a 504 by _blocking_timeout
     except Exception as e:
-        logger.error(f"Error starting microphone: {e}")
+        logger.exception("Error starting microphone")
         return jsonify({'success': False, 'error': str(e)}), 500
 
 @app.route('/api/voice/stop-microphone', methods=['POST'])
 @require_auth
 def stop_microphone():
     """Stop microphone listening"""
-    global microphone_handler
-    
     try:
         user_id = request.current_user.id
         
@@ -943,9 +1402,15 @@ def stop_microphone():
         return jsonify({'success': True, 'message': 'Microphone stopped'})
         
     except Exception as e:
-        logger.error(f"Error stopping microphone: {e}")
+        logger.exception("Error stopping microphone")
         return jsonify({'success': False, 'error': str(e)}), 500
 
+# ElevenLabs settings come from the environment loaded at startup and don't
+# change while the process runs, so /api/voice/test reports them from here
+_ELEVENLABS_KEY_SET = len(os.environ.get("ELEVENLABS_API_KEY", "")) > 10
+_ELEVENLABS_AGENT_ID_SET = bool(os.environ.get("ELEVENLABS_AGENT_ID"))
+_ELEVENLABS_VOICE_ID_SET = bool(os.environ.get("ELEVENLABS_VOICE_ID"))
+
 @app.route('/api/voice/test', methods=['POST'])
 @require_auth
 def test_voice_system():
@@ -953,35 +1418,53 @@ def test_voice_system():
     try:
         user_id = request.current_user.id
         
-        result = test_voice_synthesis()
+        result = _run_blocking(test_voice_synthesis)
         
         # Test agent initialization
-        agent_test = initialize_elevenlabs_service()
+        agent_test = _run_blocking(initialize_elevenlabs_service)
         
-        log_to_database(user_id, 'INFO', f"Voice system test completed - Result: {result}")
+        log_to_database(user_id, 'INFO', "Voice system test completed - Result: %s", args=(result,))
         
         return jsonify({
             'success': result,
             'message': 'Voice system test completed',
             'elevenlabs_available': True,  # We know it's available since we imported it
-            'api_key_set': bool(os.environ.get("ELEVENLABS_API_KEY") and len(os.environ.get("ELEVENLABS_API_KEY", "")) > 10),
-            'agent_id_set': bool(os.environ.get("ELEVENLABS_AGENT_ID")),
-            'voice_id_set': bool(os.environ.get("ELEVENLABS_VOICE_ID")),
+            'api_key_set': _ELEVENLABS_KEY_SET,
+            'agent_id_set': _ELEVENLABS_AGENT_ID_SET,
+            'voice_id_set': _ELEVENLABS_VOICE_ID_SET,
             'agent_init_success': agent_test
         })
         
+    except FutureTimeoutError:
+        raise  # Answered as a 504 by _blocking_timeout
     except Exception as e:
-        logger.error(f"Error testing voice system: {e}")
+        logger.exception("Error testing voice system")
         return jsonify({'success': False, 'error': str(e)}), 500
 
-# Static file serving routes
-@app.route('/static/<path:filename>')
-def serve_static(filename):
-    return app.send_static_file(filename)
+# Static files: WhiteNoise answers /static/* itself (cached, with ETags) when
+# installed; otherwise Flask's built-in static endpoint serves them with
+# conditional responses and SEND_FILE_MAX_AGE_DEFAULT. Behind nginx
+# (SERVE_STATIC=false) neither is registered.
+if app.static_folder and WHITENOISE_AVAILABLE:
+    app.wsgi_app = WhiteNoise(
+        app.wsgi_app,
+        root=app.static_folder,
+        prefix='static/',
+        max_age=None if app.debug else app.config['STATIC_MAX_AGE'],
+        autorefresh=app.debug
+    )
+
+if app.static_folder:
+    @app.route('/test')
+    @limiter.exempt
+    def test_page():
+        return app.send_static_file('index.html')
 
-@app.route('/test')
-def test_page():
-    return app.send_static_file('index.html')
+def join_user_rooms(rooms, sid=None):
+    """Add a client to several rooms in one call (defaults to the current client)."""
+    namespace = request.namespace if sid is None else '/'
+    for room in rooms:
+        socketio.server.enter_room(sid or request.sid, room, namespace=namespace)
 
 # WebSocket events
 @socketio.on('connect')
@@ -991,9 +1474,9 @@ def handle_connect():
     user_id = request.current_user.id if hasattr(request, 'current_user') and request.current_user else None
     
     if user_id:
-        room_name = f"user_{str(user_id)}"
-        join_room(room_name)
-        logger.info(f"Client connected: {user_id}, joined room: {room_name}")
+        room_name = _current_room()
+        join_user_rooms([room_name])
+        logger.info("Client connected: %s, joined room: %s", user_id, room_name)
         log_to_database(user_id, 'INFO', "WebSocket client connected")
     else:
         logger.info("Client connected (unauthenticated)")
@@ -1006,6 +1489,21 @@ def handle_disconnect():
     """Handle client disconnect"""
     logger.info('Client disconnected')
 
+def _wait_ready(port, timeout=5.0):
+    """Poll the local server socket until it accepts connections or timeout passes."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            if s.connect_ex(('127.0.0.1', port)) == 0:
+                return True
+        time.sleep(0.02)
+    return False
+
+def _open_browser_when_ready(port, url):
+    if not _wait_ready(port):
+        clean_log(f"Server not accepting connections on port {port}, opening browser anyway", 'WARNING')
+    webbrowser.open_new_tab(url)
+
 if __name__ == '__main__':
     port = int(os.getenv('PORT', 5000))
     host = os.getenv('HOST', '0.0.0.0')
@@ -1016,19 +1514,16 @@ if __name__ == '__main__':
     
     # Open browser in development mode (but don't rely on WERKZEUG_RUN_MAIN)
     if app.config['DEBUG']:
-        try:
-            import webbrowser
-            import threading
-            def open_browser():
-                time.sleep(2)  # Wait for server to start
-                webbrowser.open_new_tab(f"http://127.0.0.1:{port}/static/index.html")
-                clean_log(f"Opened browser to http://127.0.0.1:{port}/static/index.html")
-            
-            # Open browser in a separate thread to avoid blocking
-            browser_thread = threading.Thread(target=open_browser, daemon=True)
-            browser_thread.start()
-        except Exception as e:
-            clean_log(f"Could not open browser: {e}", 'WARNING')
+        # Open the tab as soon as the server accepts connections
+        # (green under eventlet's monkey-patching)
+        browser_url = f"http://127.0.0.1:{port}/static/index.html"
+        threading.Thread(
+            target=_open_browser_when_ready,
+            args=(port, browser_url),
+            name='open-browser',
+            daemon=True,
+        ).start()
+        clean_log(f"Opening browser to {browser_url}")
     
     # Initialize voice assistant and check if it's working properly
     clean_log("Initializing voice assistant...")
@@ -1037,7 +1532,6 @@ if __name__ == '__main__':
         
         # Also initialize ElevenLabs service separately to ensure it's working
         try:
-            from .voice_assistant import initialize_elevenlabs_service
             if initialize_elevenlabs_service():
                 clean_log("ElevenLabs agent initialized successfully")
             else:
@@ -1047,84 +1541,20 @@ if __name__ == '__main__':
     else:
         clean_log("Voice assistant initialization failed", 'ERROR')
 
-    # Use a more robust server startup method
-    try:
-        # Clean up any problematic environment variables before starting
-        problematic_vars = ['WERKZEUG_SERVER_FD', 'WERKZEUG_RUN_MAIN']
-        for var in problematic_vars:
-            if var in os.environ:
-                del os.environ[var]
-                clean_log(f"Removed problematic environment variable: {var}")
-        
-        # Force set safe environment variables
-        os.environ['WERKZEUG_RUN_MAIN'] = 'true'
-        
-        if socketio:
-            clean_log("Starting SocketIO server...")
-            try:
-                socketio.run(
-                    app,
-                    host=host,
-                    port=port,
-                    debug=False,  # Force debug to False to avoid Werkzeug issues
-                    use_reloader=False,
-                    allow_unsafe_werkzeug=True  # Allow unsafe Werkzeug for development
-                )
-            except KeyError as ke:
-                if 'WERKZEUG_SERVER_FD' in str(ke):
-                    clean_log("Werkzeug environment issue detected, trying direct Flask start...", 'WARNING')
-                    app.run(
-                        host=host,
-                        port=port,
-                        debug=False,
-                        use_reloader=False,
-                        threaded=True
-                    )
-                else:
-                    raise ke
-            except Exception as socketio_e:
-                clean_log(f"SocketIO server failed: {socketio_e}", 'ERROR')
-                clean_log("Falling back to basic Flask server...", 'WARNING')
-                app.run(
-                    host=host,
-                    port=port,
-                    debug=False,
-                    use_reloader=False,
-                    threaded=True
-                )
-        else:
-            clean_log("SocketIO not available, starting Flask app directly...")
-            app.run(
-                host=host,
-                port=port,
-                debug=False,
-                use_reloader=False,
-                threaded=True
-            )
-    except KeyError as ke:
-        if 'WERKZEUG_SERVER_FD' in str(ke):
-            clean_log("Werkzeug environment issue in main handler, using alternative startup...", 'WARNING')
-            try:
-                # Alternative startup method - create a new Flask app instance
-                from werkzeug.serving import make_server
-                server = make_server(host, port, app, threaded=True)
-                clean_log(f"Alternative server starting on {host}:{port}")
-                server.serve_forever()
-            except Exception as alt_e:
-                clean_log(f"Alternative server also failed: {alt_e}", 'ERROR')
-        else:
-            raise ke
-    except Exception as e:
-        clean_log(f"Server startup error: {e}", 'ERROR')
-        clean_log("Attempting fallback server startup...", 'WARNING')
-        try:
-            # Fallback: Simple Flask app without SocketIO
-            app.run(
-                host=host,
-                port=port,
-                debug=False,
-                use_reloader=False,
-                threaded=True
-            )
-        except Exception as fallback_e:
-            clean_log(f"Fallback server also failed: {fallback_e}", 'ERROR')
+    # The built-in server is for development; in production run under
+    # gunicorn with SOCKETIO_ASYNC_MODE=eventlet (see .env.example), where
+    # socketio.run is not used at all.
+    if socketio:
+        clean_log(f"Starting SocketIO server ({socketio.async_mode})...")
+        socketio.run(
+            app,
+            host=host,
+            port=port,
+            debug=False,
+            use_reloader=False,
+            # Only the threading mode falls back to Werkzeug
+            allow_unsafe_werkzeug=socketio.async_mode == 'threading'
+        )
+    else:
+        clean_log("SocketIO not available, starting Flask app directly...", 'WARNING')
+        app.run(host=host, port=port, debug=False, use_reloader=False, threaded=True)
@@ -7,11 +7,122 @@ import secrets
 import re
 from .models import db, User, UserSession, APIToken # Ensure models are correctly imported
 import logging
+import threading
 import uuid
-import traceback
+
+import orjson
+from cachetools import TTLCache
+from sqlalchemy.orm import joinedload
+
+from .integration_utils import get_redis_client
 
 logger = logging.getLogger(__name__)
 
+# Recently verified session/API tokens -> (user_id, expires_at), so repeat
+# requests skip the token lookup and the last-accessed write. Keys hold token
+# hashes, never raw tokens. Every code path that deactivates a token evicts
+# its key, and hits still check that the user is active. With Redis the
+# entries are shared by all workers, so an eviction anywhere applies
+# everywhere, and they live for AUTH_REDIS_TTL seconds. Without Redis they
+# live in-process for at most AUTH_CACHE_TTL seconds, which bounds how long
+# a token revoked by another worker keeps working here.
+AUTH_CACHE_TTL = 60
+AUTH_REDIS_TTL = 300
+_token_users = TTLCache(maxsize=10_000, ttl=AUTH_CACHE_TTL)
+# user_id -> cache keys remembered for that user, so all of them can be
+# evicted together (e.g. on password change); authkeys:<user_id> in Redis
+_user_token_keys = TTLCache(maxsize=10_000, ttl=AUTH_CACHE_TTL)
+_token_users_lock = threading.Lock()
+
+# Fixed id of the development fallback user created by require_auth
+DEBUG_USER_ID = uuid.UUID('00000000-0000-0000-0000-000000000001')
+
+def _auth_redis():
+    return get_redis_client(current_app.config.get('REDIS_URL'))
+
+def _load_token_entry(key):
+    client = _auth_redis()
+    if client is None:
+        with _token_users_lock:
+            return _token_users.get(key)
+    try:
+        raw = client.get(key)
+    except Exception as e:
+        logger.warning(f"Auth cache read failed: {e}")
+        return None
+    if not raw:
+        return None
+    entry = orjson.loads(raw)
+    expires_at = entry['expires_at']
+    return (
+        uuid.UUID(entry['user_id']),
+        datetime.fromisoformat(expires_at) if expires_at else None,
+    )
+
+def _session_cache_key(session_token):
+    return f"sess:{hashlib.sha256(session_token.encode()).hexdigest()}"
+
+def _cached_user(key):
+    """Return the active User for a cached token key, or None on a miss."""
+    entry = _load_token_entry(key)
+    if entry is None:
+        return None
+    user_id, expires_at = entry
+    if expires_at is not None and expires_at < datetime.utcnow():
+        _forget_token(key)
+        return None
+    user = db.session.get(User, user_id)
+    if user is None or not user.is_active:
+        _forget_token(key)
+        return None
+    return user
+
+def _remember_token(key, user_id, expires_at):
+    client = _auth_redis()
+    if client is None:
+        with _token_users_lock:
+            _token_users[key] = (user_id, expires_at)
+            keys = _user_token_keys.get(user_id, set())
+            keys.add(key)
+            _user_token_keys[user_id] = keys
+        return
+    entry = {
+        'user_id': str(user_id),
+        'expires_at': expires_at.isoformat() if expires_at else None,
+    }
+    user_keys = f"authkeys:{user_id}"
+    try:
+        pipe = client.pipeline()
+        pipe.setex(key, AUTH_REDIS_TTL, orjson.dumps(entry))
+        pipe.sadd(user_keys, key)
+        pipe.expire(user_keys, AUTH_REDIS_TTL)
+        pipe.execute()
+    except Exception as e:
+        logger.warning(f"Auth cache write failed: {e}")
+
+def _forget_token(key):
+    with _token_users_lock:
+        _token_users.pop(key, None)
+    client = _auth_redis()
+    if client is not None:
+        try:
+            client.delete(key)
+        except Exception as e:
+            logger.warning(f"Auth cache delete failed: {e}")
+
+def _forget_user_tokens(user_id):
+    """Evict every cached session/API token key of one user."""
+    with _token_users_lock:
+        for key in _user_token_keys.pop(user_id, ()):
+            _token_users.pop(key, None)
+    client = _auth_redis()
+    if client is not None:
+        user_keys = f"authkeys:{user_id}"
+        try:
+            client.delete(*client.smembers(user_keys), user_keys)
+        except Exception as e:
+            logger.warning(f"Auth cache delete failed: {e}")
+
 class AuthService:
     """Complete authentication service"""
 
@@ -143,8 +254,16 @@ class AuthService:
     @staticmethod
     def get_user_from_session(session_token):
         """Get user from session token"""
+        cache_key = _session_cache_key(session_token)
         try:
-            session_obj = UserSession.query.filter_by(
+            user = _cached_user(cache_key)
+            if user:
+                return user
+
+            # Load the session and its user in one joined SELECT
+            session_obj = UserSession.query.options(
+                joinedload(UserSession.user)
+            ).filter_by(
                 session_token=session_token,
                 is_active=True
             ).first()
@@ -155,13 +274,20 @@ class AuthService:
             if session_obj.is_expired():
                 session_obj.deactivate()
                 db.session.commit()
+                _forget_token(cache_key)
+                return None
+
+            # Read what we need before the commit expires the loaded rows
+            user = session_obj.user
+            if not user.is_active:
                 return None
+            _remember_token(cache_key, session_obj.user_id, session_obj.expires_at)
 
             # Update last accessed
             session_obj.last_accessed = datetime.utcnow()
             db.session.commit()
 
-            return session_obj.user
+            return user
 
         except Exception as e:
             logger.error(f"Session lookup error: {str(e)}")
@@ -172,8 +298,14 @@ class AuthService:
         """Get user from API token"""
         try:
             token_hash = hashlib.sha256(token.encode()).hexdigest()
-
-            api_token = APIToken.query.filter_by(
+            cache_key = f"apitok:{token_hash}"
+            user = _cached_user(cache_key)
+            if user:
+                return user
+
+            api_token = APIToken.query.options(
+                joinedload(APIToken.user)
+            ).filter_by(
                 token_hash=token_hash,
                 is_active=True
             ).first()
@@ -184,13 +316,19 @@ class AuthService:
             if api_token.is_expired():
                 api_token.is_active = False # Mark as inactive if expired
                 db.session.commit()
+                _forget_token(cache_key)
+                return None
+
+            user = api_token.user
+            if not user.is_active:
                 return None
+            _remember_token(cache_key, api_token.user_id, api_token.expires_at)
 
             # Update last used
             api_token.update_last_used()
             db.session.commit()
 
-            return api_token.user
+            return user
 
         except Exception as e:
             logger.error(f"API token lookup error: {str(e)}")
@@ -199,6 +337,7 @@ class AuthService:
     @staticmethod
     def logout_user(session_token):
         """Logout user by deactivating session"""
+        AuthService.forget_cached_session(session_token)
         try:
             session_obj = UserSession.query.filter_by(
                 session_token=session_token
@@ -216,6 +355,17 @@ class AuthService:
             logger.error(f"Logout error: {str(e)}")
             return False
 
+    @staticmethod
+    def forget_cached_session(session_token):
+        """Evict a session token from the auth cache so the next request re-reads it."""
+        if session_token:
+            _forget_token(_session_cache_key(session_token))
+
+    @staticmethod
+    def forget_cached_user(user_id):
+        """Evict all of a user's cached tokens so every request re-reads them."""
+        _forget_user_tokens(user_id)
+
     @staticmethod
     def cleanup_expired_sessions(user_id=None):
         """Cleanup expired sessions"""
@@ -227,9 +377,16 @@ class AuthService:
             if user_id:
                 query = query.filter_by(user_id=user_id)
 
+            # Tokens still marked active are the ones that may be cached
+            expired_tokens = [token for (token,) in query.filter(
+                UserSession.is_active.is_(True)
+            ).with_entities(UserSession.session_token)]
+
             # Deactivate expired sessions
             expired_count = query.update({UserSession.is_active: False})
             db.session.commit()
+            for token in expired_tokens:
+                AuthService.forget_cached_session(token)
 
             if expired_count > 0:
                 logger.info(f"Cleaned up {expired_count} expired sessions")
@@ -260,13 +417,14 @@ def require_auth(f):
         if not user and current_app.config.get('DEBUG'):
             with current_app.app_context():
                 try:
-                    # Reduce logging noise by checking if user exists first
-                    user = User.query.filter_by(email='testuser@example.com').first()
+                    # Primary-key lookup first: served from the identity map
+                    # when the user is already loaded in this session
+                    user = db.session.get(User, DEBUG_USER_ID)
+                    if not user:
+                        user = User.query.filter_by(email='testuser@example.com').first()
                     if not user:
                         logger.info("Creating debug fallback user for development.")
-                        # Ensure UUID object is passed correctly
-                        test_user_uuid = uuid.UUID('00000000-0000-0000-0000-000000000001')
-                        user = User(id=test_user_uuid, username='testuser', email='testuser@example.com')
+                        user = User(id=DEBUG_USER_ID, username='testuser', email='testuser@example.com')
                         user.set_password('TestPassword123!') 
                         db.session.add(user)
                         db.session.commit()
@@ -277,9 +435,8 @@ def require_auth(f):
                     elif not hasattr(request, '_debug_user_logged'):
                         logger.debug("Using existing debug fallback user for development.")
                         request._debug_user_logged = True
-                except Exception as e:
-                    logger.error(f"Error with debug user: {e}")
-                    logger.error(traceback.format_exc())
+                except Exception:
+                    logger.exception("Error with debug user")
 
         if not user:
             return jsonify({
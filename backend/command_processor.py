@@ -340,7 +340,7 @@ class VoiceCommandProcessor:
                     time.sleep(delay_minutes * 60)
                     
                     from models import db, UserNotification
-                    notification = UserNotification.query.get(notification_id)
+                    notification = db.session.get(UserNotification, notification_id)
                     if notification and not notification.is_dismissed:
                         notification.extra_info['triggered'] = True
                         notification.extra_info['triggered_at'] = datetime.utcnow().isoformat()
@@ -365,7 +365,6 @@ class VoiceCommandProcessor:
         """
         logger.info(f"Setting a timer '{timer_name}' for {duration_seconds} seconds.")
         
-        import uuid
         timer_id = str(uuid.uuid4())
         
         try:
@@ -19,11 +19,42 @@ class Config:
     SQLALCHEMY_DATABASE_URI = os.getenv('DATABASE_URL', 'sqlite:///' + os.path.join(instance_path, 'assistant.db'))
     # --- END OF FIX ---
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    # Connection pool for server databases: LIFO keeps the most recently used
+    # connection warm, recycling replaces stale ones instead of a SELECT 1
+    # pre-ping on every checkout (DB_POOL_PRE_PING=true turns it back on for
+    # databases that drop connections unpredictably). SQLite keeps
+    # SQLAlchemy's default pool.
+    SQLALCHEMY_ENGINE_OPTIONS = {} if SQLALCHEMY_DATABASE_URI.startswith('sqlite') else {
+        'pool_size': int(os.getenv('DB_POOL_SIZE', 20)),
+        'max_overflow': int(os.getenv('DB_MAX_OVERFLOW', 40)),
+        'pool_pre_ping': os.getenv('DB_POOL_PRE_PING', 'false').lower() == 'true',
+        'pool_recycle': 1800,
+        'pool_use_lifo': True,
+    }
+    if SQLALCHEMY_DATABASE_URI.startswith('postgres'):
+        # Cap runaway queries (e.g. deep log scans) so they can't pin pool connections
+        SQLALCHEMY_ENGINE_OPTIONS['connect_args'] = {
+            'options': f"-c statement_timeout={int(os.getenv('DB_STATEMENT_TIMEOUT_MS', 5000))}"
+        }
     
     # Server Configuration
     HOST = os.getenv('HOST', '0.0.0.0')
     PORT = int(os.getenv('PORT', 5000))
     
+    # Socket.IO server mode: 'threading' (default; WebSocket via
+    # simple-websocket) or 'eventlet' for green-thread concurrency, e.g.
+    # under gunicorn -k eventlet
+    SOCKETIO_ASYNC_MODE = os.getenv('SOCKETIO_ASYNC_MODE', 'threading')
+    # Socket.IO packet encoding: 'default' (JSON) or 'msgpack' for smaller
+    # binary frames; msgpack needs the frontend built with the same setting
+    SOCKETIO_SERIALIZER = os.getenv('SOCKETIO_SERIALIZER', 'default')
+    
+    # Serve /static from Flask; set to false when a reverse proxy serves it
+    SERVE_STATIC = os.getenv('SERVE_STATIC', 'true').lower() == 'true'
+    # Browser cache lifetime for static files outside debug (they aren't
+    # fingerprinted); app.py applies it once app.debug is known
+    STATIC_MAX_AGE = 3600
+    
     # ElevenLabs Configuration
     AGENT_ID = os.getenv('ELEVENLABS_AGENT_ID')
     API_KEY = os.getenv('ELEVENLABS_API_KEY')
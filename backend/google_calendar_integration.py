@@ -1,11 +1,15 @@
 import os
 import pickle
+import threading
 from datetime import datetime, timedelta
+import httplib2
+import google_auth_httplib2
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from googleapiclient.http import HttpRequest
 import re
 from dateutil import parser
 from dateutil.relativedelta import relativedelta
@@ -25,6 +29,20 @@ CREDENTIALS_PATH = os.path.join(BASE_DIR, 'credentials.json')
 # Global variable to hold the authenticated service object
 # This will be managed by the Flask app context for efficiency
 _cached_calendar_service = None
+_calendar_service_lock = threading.Lock()
+
+# httplib2 connections aren't thread-safe, so the shared service hands each
+# thread its own authorized connection (reused across that thread's calls)
+_thread_http = threading.local()
+
+def _thread_request_builder(creds):
+    def build_request(http, *args, **kwargs):
+        authed = getattr(_thread_http, 'authed', None)
+        if authed is None or authed.credentials is not creds:
+            authed = google_auth_httplib2.AuthorizedHttp(creds, http=httplib2.Http())
+            _thread_http.authed = authed
+        return HttpRequest(authed, *args, **kwargs)
+    return build_request
 
 def authenticate_google_calendar():
     """
@@ -79,7 +97,13 @@ def authenticate_google_calendar():
         except Exception as e:
             logger.error(f"Error saving token.pickle: {e}")
 
-    return build('calendar', 'v3', credentials=creds)
+    # Bundled discovery document, so building the client makes no request
+    return build(
+        'calendar', 'v3',
+        credentials=creds,
+        requestBuilder=_thread_request_builder(creds),
+        cache_discovery=False,
+    )
 
 def get_calendar_service():
     """
@@ -88,9 +112,12 @@ def get_calendar_service():
     """
     global _cached_calendar_service
     if _cached_calendar_service is None:
-        logger.info("Google Calendar service not cached, authenticating now...")
-        _cached_calendar_service = authenticate_google_calendar()
-        logger.info("Google Calendar service cached.")
+        # Locked so concurrent first requests don't each run the OAuth flow
+        with _calendar_service_lock:
+            if _cached_calendar_service is None:
+                logger.info("Google Calendar service not cached, authenticating now...")
+                _cached_calendar_service = authenticate_google_calendar()
+                logger.info("Google Calendar service cached.")
     return _cached_calendar_service
 
 def get_today_schedule():
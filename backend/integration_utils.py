@@ -4,15 +4,41 @@ Compatible with SQLAlchemy 1.4 and Flask 2.x
 """
 import logging
 import functools
-import traceback
 import sys
 import uuid
 from datetime import datetime, timezone
 from flask import jsonify, request, session, g
 from werkzeug.exceptions import BadRequest
 
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    redis = None
+    REDIS_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+_redis_clients = {}
+
+def get_redis_client(url):
+    """Return a connected Redis client for url, or None if Redis isn't usable.
+
+    The outcome is remembered per URL so callers sharing a server share one
+    connection pool and an unreachable server is only probed once.
+    """
+    if not url or not REDIS_AVAILABLE:
+        return None
+    if url not in _redis_clients:
+        try:
+            client = redis.Redis.from_url(url, socket_connect_timeout=0.5)
+            client.ping()
+        except Exception as e:
+            logger.warning(f"Redis at {url} unavailable: {e}")
+            client = None
+        _redis_clients[url] = client
+    return _redis_clients[url]
+
 def setup_enhanced_logging():
     """Setup enhanced logging configuration with better formatting."""
     log_format = logging.Formatter(
@@ -53,8 +79,7 @@ def enhanced_error_handler(func):
         try:
             return func(*args, **kwargs)
         except Exception as e:
-            logger.error(f"Error in {func.__name__}: {str(e)}")
-            logger.error(traceback.format_exc())
+            logger.exception("Error in %s", func.__name__)
             
             # Try to log to database if possible
             try:
@@ -159,7 +159,7 @@ class ConversationMemory:
             return
             
         try:
-            conversation = Conversation.query.get(conversation_id)
+            conversation = db.session.get(Conversation, conversation_id)
             if conversation:
                 conversation.is_active = False
                 conversation.end_time = datetime.utcnow()
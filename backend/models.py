@@ -259,6 +259,36 @@ class Log(db.Model):
     source = db.Column(String(50), nullable=True, default='unknown')
     extra_data = db.Column(db.JSON, default=lambda: {})
 
+    # Serves the per-user newest-first listing in /api/logs without a sort
+    __table_args__ = (
+        db.Index('ix_logs_user_ts', 'user_id', timestamp.desc(), id.desc()),
+    )
+
+    # Columns serialized by to_dict; selecting just these yields plain rows
+    # that row_to_dict can serialize without building Log instances
+    COLUMNS = (id, user_id, conversation_id, timestamp, level, message, source, extra_data)
+
+    @staticmethod
+    def row_to_dict(row):
+        """Serialize a Log or a row selected with Log.COLUMNS.
+
+        user_id and timestamp are left as UUID/datetime; the app's orjson
+        provider encodes them in the same form str()/isoformat() would.
+        """
+        return {
+            'id': row.id,
+            'user_id': row.user_id,
+            'conversation_id': row.conversation_id,
+            'timestamp': row.timestamp,
+            'level': row.level,
+            'message': row.message,
+            'source': row.source,
+            'extra_data': row.extra_data
+        }
+
+    def to_dict(self):
+        return Log.row_to_dict(self)
+
     def __repr__(self):
         return f"<Log {self.id} [{self.level}] {self.message[:50]}>"
 
@@ -0,0 +1,66 @@
+"""
+Request body schemas for the JSON API endpoints.
+Each model validates and strips the raw request body in a single pass of
+pydantic's compiled validator instead of per-field get/strip chains.
+"""
+from typing import Optional, Tuple, Type, TypeVar
+
+from flask import request
+from pydantic import BaseModel, Field, StrictInt, StringConstraints, ValidationError
+from typing_extensions import Annotated
+
+Stripped = Annotated[str, StringConstraints(strip_whitespace=True)]
+RequiredStripped = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
+RequiredStr = Annotated[str, StringConstraints(min_length=1)]
+
+class RegisterRequest(BaseModel):
+    username: Stripped = ''
+    email: Stripped = ''
+    password: str = ''
+    first_name: Optional[Stripped] = None
+    last_name: Optional[Stripped] = None
+
+class LoginRequest(BaseModel):
+    username: RequiredStripped
+    password: RequiredStr
+
+class ChangePasswordRequest(BaseModel):
+    current_password: RequiredStr
+    new_password: RequiredStr
+
+class RescheduleEventRequest(BaseModel):
+    new_start_time: RequiredStr
+
+class EventReminderRequest(BaseModel):
+    minutes_before: StrictInt = Field(gt=0)
+
+class TranscriptRequest(BaseModel):
+    transcript: RequiredStripped
+
+class VoiceInputRequest(BaseModel):
+    text: RequiredStripped
+
+Model = TypeVar('Model', bound=BaseModel)
+
+def parse_request(model: Type[Model]) -> Tuple[Optional[Model], Optional[ValidationError]]:
+    """Validate the raw request body against model.
+
+    Returns (instance, None) on success or (None, error) if the body is
+    missing, is not JSON, or fails validation.
+    """
+    try:
+        return model.model_validate_json(request.get_data()), None
+    except ValidationError as e:
+        return None, e
+
+def error_message(error: ValidationError) -> str:
+    """Describe the first problem in a parse_request error for a 400 response.
+
+    A missing body, a body that isn't JSON, and a bad field each get their
+    own message, the last as '<field>: <pydantic message>'.
+    """
+    first = error.errors(include_url=False)[0]
+    if first['type'] == 'json_invalid':
+        return "No data provided" if not first.get('input') else "Request body is not valid JSON"
+    field = '.'.join(str(part) for part in first['loc'])
+    return f"{field}: {first['msg']}" if field else first['msg']
@@ -0,0 +1,48 @@
+# backend/tests/conftest.py
+import os
+
+import pytest
+from flask import Flask
+
+# backend.config reads these at import: keep tests on an in-memory database
+# and off any local Redis
+os.environ.setdefault('DATABASE_URL', 'sqlite://')
+os.environ.setdefault('REDIS_URL', '')
+os.environ.setdefault('RATE_LIMIT_STORAGE_URL', '')
+
+from backend.models import db  # noqa: E402
+
+
+@pytest.fixture
+def app():
+    """Bare Flask app on in-memory SQLite with the project's models."""
+    app = Flask(__name__)
+    app.config.update(
+        TESTING=True,
+        SECRET_KEY='test-secret',
+        SQLALCHEMY_DATABASE_URI='sqlite://',
+        SQLALCHEMY_TRACK_MODIFICATIONS=False,
+        REDIS_URL=None,
+    )
+    db.init_app(app)
+    with app.app_context():
+        db.create_all()
+    yield app
+    with app.app_context():
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.fixture(scope='session')
+def backend_app():
+    """The real backend.app module, imported once for the whole session."""
+    from backend import app as app_module
+    app_module.app.config['TESTING'] = True
+    app_module.limiter.enabled = False
+    return app_module
+
+
+@pytest.fixture
+def api_client(backend_app):
+    """Test client for the real app; development config falls back to the debug user."""
+    return backend_app.app.test_client()
@@ -0,0 +1,76 @@
+# backend/tests/test_auth_cache.py
+import uuid
+
+import pytest
+
+from backend import auth_service
+from backend.auth_service import AuthService, _session_cache_key
+from backend.models import User, db
+
+PASSWORD = 'Corr3ct-horse!'
+
+
+@pytest.fixture
+def user(backend_app):
+    name = f"u{uuid.uuid4().hex[:10]}"
+    with backend_app.app.app_context():
+        ok, user = AuthService.register_user(name, f"{name}@example.com", PASSWORD)
+        assert ok, user
+        return user.id, name
+
+
+def _cached(session_token):
+    return _session_cache_key(session_token) in auth_service._token_users
+
+
+def _new_session(user_id):
+    user = db.session.get(User, user_id)
+    token = AuthService.create_session(user).session_token
+    assert AuthService.get_user_from_session(token).id == user_id
+    return token
+
+
+def test_session_cache_key_hides_token():
+    assert 'secret-token' not in _session_cache_key('secret-token')
+
+
+def test_logout_evicts_cached_session(backend_app, user):
+    user_id, _ = user
+    with backend_app.app.test_request_context():
+        token = _new_session(user_id)
+        assert _cached(token)
+
+        AuthService.logout_user(token)
+
+        assert not _cached(token)
+        assert AuthService.get_user_from_session(token) is None
+
+
+def test_deactivated_user_misses_cache(backend_app, user):
+    user_id, _ = user
+    with backend_app.app.test_request_context():
+        token = _new_session(user_id)
+        db.session.get(User, user_id).is_active = False
+        db.session.commit()
+
+        assert AuthService.get_user_from_session(token) is None
+        assert not _cached(token)
+
+
+def test_password_change_evicts_all_user_sessions(backend_app, api_client, user):
+    user_id, name = user
+    response = api_client.post('/api/auth/login', json={'username': name, 'password': PASSWORD})
+    assert response.status_code == 200
+    login_token = response.get_json()['session_token']
+    assert api_client.get('/api/auth/me').status_code == 200
+    with backend_app.app.test_request_context():
+        other_token = _new_session(user_id)
+    assert _cached(login_token) and _cached(other_token)
+
+    response = api_client.post('/api/auth/change-password', json={
+        'current_password': PASSWORD, 'new_password': PASSWORD + 'x',
+    })
+
+    assert response.status_code == 200
+    assert not _cached(login_token)
+    assert not _cached(other_token)
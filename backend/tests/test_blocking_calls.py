@@ -0,0 +1,26 @@
+# backend/tests/test_blocking_calls.py
+import time
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+import pytest
+
+
+def _slow():
+    time.sleep(0.5)
+    return True
+
+
+def test_run_blocking_times_out(backend_app, monkeypatch):
+    monkeypatch.setattr(backend_app, '_BLOCKING_TIMEOUT', 0.05)
+    with pytest.raises(FutureTimeoutError):
+        backend_app._run_blocking(_slow)
+
+
+def test_voice_test_route_answers_504_on_timeout(backend_app, api_client, monkeypatch):
+    monkeypatch.setattr(backend_app, '_BLOCKING_TIMEOUT', 0.05)
+    monkeypatch.setattr(backend_app, 'test_voice_synthesis', _slow)
+
+    response = api_client.post('/api/voice/test')
+
+    assert response.status_code == 504
+    assert response.get_json()['success'] is False
@@ -0,0 +1,30 @@
+# backend/tests/test_log_queue.py
+import queue
+
+from backend.models import Log, db
+
+
+def test_full_queue_drops_oldest_row(backend_app, monkeypatch):
+    monkeypatch.setattr(backend_app, '_log_q', queue.Queue(maxsize=2))
+    monkeypatch.setattr(backend_app, '_dropped_log_rows', 0)
+
+    for i in range(3):
+        backend_app.log_to_database(None, 'INFO', f"row {i}")
+
+    queued = [backend_app._log_q.get_nowait()['message'] for _ in range(2)]
+    assert queued == ['row 1', 'row 2']
+    assert backend_app._dropped_log_rows == 1
+
+
+def test_write_log_batch_formats_args_on_the_writer(backend_app, monkeypatch):
+    monkeypatch.setattr(backend_app, '_log_q', queue.Queue())
+    backend_app.log_to_database(None, 'INFO', "Voice input received: %s", args=('hello',))
+    row = backend_app._log_q.get_nowait()
+
+    backend_app._write_log_batch([row])
+
+    with backend_app.app.app_context():
+        log = Log.query.filter_by(message="Voice input received: hello").one()
+        assert log.timestamp.tzinfo is None
+        db.session.delete(log)
+        db.session.commit()
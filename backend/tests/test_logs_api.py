@@ -0,0 +1,47 @@
+# backend/tests/test_logs_api.py
+from datetime import datetime, timedelta
+
+import pytest
+
+from backend.auth_service import DEBUG_USER_ID
+from backend.models import Log, db
+
+
+@pytest.fixture
+def future_logs(backend_app, api_client):
+    """Five logs for the debug user, dated after anything else in the table."""
+    api_client.get('/api/auth/me')  # Creates the debug fallback user
+    base = datetime(2100, 1, 1)
+    with backend_app.app.app_context():
+        rows = [
+            Log(user_id=DEBUG_USER_ID, level='INFO', message=f"entry {i}",
+                timestamp=base + timedelta(minutes=i))
+            for i in range(5)
+        ]
+        db.session.add_all(rows)
+        db.session.commit()
+        ids = [row.id for row in rows]
+    yield ids
+    with backend_app.app.app_context():
+        Log.query.filter(Log.id.in_(ids)).delete(synchronize_session=False)
+        db.session.commit()
+
+
+def test_logs_cursor_walks_two_pages(api_client, future_logs):
+    first = api_client.get('/api/logs?limit=3').get_json()['data']
+    assert [log['message'] for log in first['logs']] == ['entry 4', 'entry 3', 'entry 2']
+    assert first['has_more'] is True
+
+    cursor = first['next_cursor']
+    second = api_client.get('/api/logs', query_string={
+        'limit': 2, 'before': cursor['before'], 'before_id': cursor['before_id'],
+    }).get_json()['data']
+    assert [log['message'] for log in second['logs']] == ['entry 1', 'entry 0']
+
+
+def test_logs_page_param_keeps_offset_response(api_client, future_logs):
+    data = api_client.get('/api/logs?page=1&per_page=2').get_json()['data']
+    assert [log['message'] for log in data['logs']] == ['entry 4', 'entry 3']
+    assert data['page'] == 1
+    assert data['total'] >= 5
+    assert data['pages'] >= 3
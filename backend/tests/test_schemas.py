@@ -0,0 +1,36 @@
+# backend/tests/test_schemas.py
+from flask import Flask
+
+from backend.schemas import EventReminderRequest, LoginRequest, error_message, parse_request
+
+
+def _parse(model, body):
+    app = Flask(__name__)
+    with app.test_request_context(data=body, content_type='application/json'):
+        return parse_request(model)
+
+
+def test_valid_body_is_stripped():
+    data, error = _parse(LoginRequest, '{"username": "  alice ", "password": "pw"}')
+    assert error is None
+    assert data.username == 'alice'
+
+
+def test_missing_body():
+    _, error = _parse(LoginRequest, '')
+    assert error_message(error) == "No data provided"
+
+
+def test_malformed_body():
+    _, error = _parse(LoginRequest, '{"username": ')
+    assert error_message(error) == "Request body is not valid JSON"
+
+
+def test_missing_field_names_the_field():
+    _, error = _parse(LoginRequest, '{"username": "alice"}')
+    assert error_message(error).startswith("password: ")
+
+
+def test_wrong_type_names_the_field():
+    _, error = _parse(EventReminderRequest, '{"minutes_before": "ten"}')
+    assert error_message(error).startswith("minutes_before: ")
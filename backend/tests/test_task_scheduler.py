@@ -0,0 +1,69 @@
+# backend/tests/test_task_scheduler.py
+import threading
+import time
+
+from backend.api_client import TaskScheduler
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_tasks_run_in_due_order():
+    scheduler = TaskScheduler()
+    fired = []
+    scheduler.schedule_timer('late', 0.15, fired.append, 'late')
+    scheduler.schedule_timer('early', 0.05, fired.append, 'early')
+    scheduler.schedule_timer('middle', 0.1, fired.append, 'middle')
+
+    assert _wait_for(lambda: len(fired) == 3)
+    assert fired == ['early', 'middle', 'late']
+    assert scheduler.get_active_tasks() == {}
+
+
+def test_cancel_pending_task():
+    scheduler = TaskScheduler()
+    fired = []
+    scheduler.schedule_timer('t', 0.1, fired.append, 't')
+
+    assert scheduler.cancel_task('t') is True
+    assert scheduler.cancel_task('t') is False
+    time.sleep(0.25)
+    assert fired == []
+    assert scheduler._cancelled == set()
+
+
+def test_cancel_unknown_task():
+    assert TaskScheduler().cancel_task('missing') is False
+
+
+def test_cancel_running_task_is_refused():
+    scheduler = TaskScheduler()
+    started, release = threading.Event(), threading.Event()
+
+    def callback():
+        started.set()
+        release.wait(5)
+
+    scheduler.schedule_timer('t', 0, callback)
+    assert started.wait(5)
+    assert scheduler.cancel_task('t') is False
+    release.set()
+    assert _wait_for(lambda: scheduler.get_active_tasks() == {})
+    assert scheduler._inflight == set()
+
+
+def test_rescheduling_replaces_pending_task():
+    scheduler = TaskScheduler()
+    fired = []
+    scheduler.schedule_timer('t', 0.05, fired.append, 'first')
+    scheduler.schedule_timer('t', 0.1, fired.append, 'second')
+
+    assert _wait_for(lambda: fired)
+    time.sleep(0.1)
+    assert fired == ['second']
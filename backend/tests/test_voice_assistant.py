@@ -0,0 +1,70 @@
+# backend/tests/test_voice_assistant.py
+import threading
+import time
+import uuid
+
+from backend import voice_assistant as va_module
+from backend.voice_assistant import VoiceAssistant
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_switching_user_while_new_session_is_opening(app, monkeypatch):
+    monkeypatch.setattr(va_module, 'initialize_elevenlabs_service', lambda: False)
+
+    # Hold the first session in its greeting so it hasn't consumed its
+    # SHUTDOWN_SIGNAL yet when the next user starts
+    greeting_gate = threading.Event()
+    monkeypatch.setattr(
+        VoiceAssistant, '_play_text_via_modern_api',
+        lambda self, text, voice=None: greeting_gate.wait(5),
+    )
+
+    db_logs = []
+    assistant = VoiceAssistant(
+        app, on_status_change=None, on_log=None,
+        on_log_to_db=lambda *row: db_logs.append(row),
+    )
+    user_a, user_b = uuid.uuid4(), uuid.uuid4()
+
+    assert assistant.start_listening(user_a)[0]
+    assistant.stop_listening()
+
+    opening = threading.Event()
+    open_gate = threading.Event()
+
+    def slow_open(func, *args):
+        opening.set()
+        open_gate.wait(5)
+        return func(*args)
+
+    result = {}
+    starter = threading.Thread(
+        target=lambda: result.update(ret=assistant.start_listening(user_b, run_blocking=slow_open))
+    )
+    starter.start()
+    assert opening.wait(5)
+
+    # Let the old session run on while user B's session is still opening
+    greeting_gate.set()
+    assert _wait_for(lambda: any(row[2] == "Voice assistant session ended." for row in db_logs))
+
+    open_gate.set()
+    starter.join(5)
+
+    assert result['ret'][0] is True
+    assert assistant.is_listening
+    assert assistant.status == "Listening"
+    assert assistant.user_id == user_b
+    ended = [row for row in db_logs if row[2] == "Voice assistant session ended."]
+    assert [row[0] for row in ended] == [user_a]
+
+    assistant.stop_listening()
+    assert assistant.wait_stopped(timeout=5)
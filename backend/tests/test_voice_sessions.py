@@ -0,0 +1,87 @@
+# backend/tests/test_voice_sessions.py
+import time
+
+import pytest
+from flask import Flask, request
+from itsdangerous import TimestampSigner
+
+from backend.voice_sessions import (
+    InMemoryVoiceSessionStore,
+    RedisVoiceSessionStore,
+    VoiceSessionCookie,
+)
+
+USER_ID = '3f1c8a52-2a8e-4a8e-9d61-0d5f5f0a1b11'
+
+
+def _cookie_token(cookie, data):
+    app = Flask(__name__)
+    with app.test_request_context():
+        response = cookie.save(app.response_class(), USER_ID, data)
+    header = response.headers['Set-Cookie']
+    return header.split(';', 1)[0].split('=', 1)[1]
+
+
+def _load(cookie, token, user_id=USER_ID):
+    app = Flask(__name__)
+    with app.test_request_context(headers={'Cookie': f"{cookie.name}={token}"}):
+        return cookie.load(request, user_id)
+
+
+def test_cookie_round_trip():
+    cookie = VoiceSessionCookie('test-secret', ttl=60)
+    token = _cookie_token(cookie, {'active': True, 'started_at_ns': 123})
+    assert _load(cookie, token) == {'active': True, 'started_at_ns': 123, 'stopped_at_ns': None}
+
+
+def test_cookie_for_another_user_is_ignored():
+    cookie = VoiceSessionCookie('test-secret', ttl=60)
+    token = _cookie_token(cookie, {'active': True})
+    assert _load(cookie, token, user_id='someone-else') is None
+
+
+def test_cookie_older_than_ttl_is_rejected(monkeypatch):
+    cookie = VoiceSessionCookie('test-secret', ttl=60)
+    token = _cookie_token(cookie, {'active': True})
+    later = int(time.time()) + 61
+    monkeypatch.setattr(TimestampSigner, 'get_timestamp', lambda self: later)
+    assert _load(cookie, token) is None
+
+
+@pytest.fixture(params=['memory', 'redis'])
+def store(request):
+    if request.param == 'memory':
+        return InMemoryVoiceSessionStore()
+    fakeredis = pytest.importorskip('fakeredis')
+    return RedisVoiceSessionStore(fakeredis.FakeRedis())
+
+
+def test_store_set_default_keeps_existing_session(store):
+    store.set_default('u1', {'active': True, 'started_at_ns': 1})
+    store.set_default('u1', {'active': False, 'started_at_ns': 2})
+    assert store.get('u1') == {'active': True, 'started_at_ns': 1}
+
+
+def test_store_update_merges_fields(store):
+    assert store.update('u1', active=True) is False
+    assert store.get('u1') is None
+
+    store.set('u1', {'active': True, 'started_at_ns': 1})
+    assert store.update('u1', active=False, stopped_at_ns=5) is True
+    assert store.get('u1') == {'active': False, 'started_at_ns': 1, 'stopped_at_ns': 5}
+
+
+def test_store_active_count_follows_active_flag(store):
+    store.set('u1', {'active': True})
+    store.set_default('u2', {'active': True})
+    store.set('u3', {'active': False})
+    assert store.active_count() == 2
+
+    store.update('u1', active=False)
+    assert store.active_count() == 1
+
+    # Updating other fields leaves an active session counted
+    store.update('u2', started_at_ns=7)
+    assert store.active_count() == 1
+    store.set('u2', {'active': False})
+    assert store.active_count() == 0
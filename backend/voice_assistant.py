@@ -4,11 +4,10 @@ Enhanced Voice Assistant with ElevenLabs Agent Integration
 """
 import os
 import sys
-import traceback
 import logging
 import time
 from threading import Thread, Event
-import queue
+import collections
 import json
 from datetime import datetime, timezone
 import re
@@ -434,7 +433,6 @@ class SimpleVoiceAssistant:
         self.user_id = user_id
         self.conversation_id = conversation_id
         self.is_listening = False
-        self.user_transcript_queue = queue.Queue()
         
         # Initialize ElevenLabs agent
         global elevenlabs_service
@@ -472,7 +470,7 @@ class SimpleVoiceAssistant:
         
         try:
             # Get user information
-            user = User.query.get(self.user_id)
+            user = db.session.get(User, self.user_id)
             user_name = user.username if user else "User"
             
             # Process input and generate response
@@ -485,8 +483,7 @@ class SimpleVoiceAssistant:
             
         except Exception as e:
             error_msg = f"Error processing input: {str(e)}"
-            logger.error(error_msg)
-            logger.error(traceback.format_exc())
+            logger.exception(error_msg)
             _log_and_commit(self.user_id, 'ERROR', error_msg, self.conversation_id)
             return "I encountered an error processing your request. Please try again."
 
@@ -584,8 +581,7 @@ def process_voice_command(text_input):
         return response
 
     except Exception as e:
-        logger.error(f"✗ Error processing voice command: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception(f"✗ Error processing voice command: {e}")
         return f"I encountered an error: {str(e)}"
 
 def _start_voice_assistant_internal(user_id: uuid.UUID):
@@ -603,7 +599,7 @@ def _start_voice_assistant_internal(user_id: uuid.UUID):
             logger.warning("⚠️  ElevenLabs agent not available, using fallback TTS")
         
         # Get user information
-        user = User.query.get(user_id)
+        user = db.session.get(User, user_id)
         user_name = user.username if user else "User"
         
         # Create new conversation
@@ -638,8 +634,7 @@ def _start_voice_assistant_internal(user_id: uuid.UUID):
         return True
         
     except Exception as e:
-        logger.error(f"✗ Error starting voice assistant: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception(f"✗ Error starting voice assistant: {e}")
         _log_and_commit(user_id, 'ERROR', f"Failed to start voice assistant: {str(e)}", None)
         _update_status("error", f"Failed to start: {str(e)}")
         return False
@@ -687,6 +682,10 @@ def start_voice_assistant(user_id: uuid.UUID, app_instance: Flask, retries: int
                 except Exception as cleanup_e:
                     logger.error(f"✗ Error cleaning up database session: {cleanup_e}")
 
+# Upper bound on transcripts waiting for the listening loop; producers are
+# turned away beyond this instead of letting the backlog grow
+MAX_PENDING_TRANSCRIPTS = 256
+
 # Keep existing VoiceAssistant class for compatibility
 class VoiceAssistant:
     def __init__(self, app_instance, on_status_change, on_log, on_log_to_db):
@@ -697,12 +696,38 @@ class VoiceAssistant:
         _on_log_to_db = on_log_to_db
         set_flask_app_for_command_processor(app_instance)
 
+        # One long-lived worker runs listening sessions back to back, so
+        # start/stop cycles reuse a thread and sessions never overlap
         self.listening_thread = None
+        self._session_requested = threading.Event()
+        self._worker_lock = threading.Lock()
         self.is_listening = False
         self.status = "Inactive"
         self.user_id = None
         self.conversation_id = None
-        self.user_transcript_queue = queue.Queue()
+        # Transcripts from request/microphone threads; deque appends are atomic,
+        # so producers only touch the event to wake the listening loop
+        self._transcripts = collections.deque()
+        self._transcript_ready = threading.Event()
+        # Set whenever no listening loop is running
+        self._stopped = threading.Event()
+        self._stopped.set()
+        # Bumped by every start; a session only acts while it is current
+        self._generation = 0
+        # (generation, user_id, conversation_id) for the worker's next session
+        self._pending_session = None
+
+    def submit_transcript(self, transcript, force=False):
+        """Queue a transcript for the listening loop.
+
+        Returns False without queuing when MAX_PENDING_TRANSCRIPTS are already
+        waiting, unless force is set (used for the shutdown signal).
+        """
+        if not force and len(self._transcripts) >= MAX_PENDING_TRANSCRIPTS:
+            return False
+        self._transcripts.append(transcript)
+        self._transcript_ready.set()
+        return True
 
     def _log_to_frontend(self, message, level):
         """Logs a message to the console and sends it to the frontend via callback."""
@@ -729,41 +754,111 @@ class VoiceAssistant:
             logger.error(f"Error in _play_text_via_modern_api: {e}")
             self._log_to_frontend(f"✗ Error playing audio: {str(e)}", 'error')
 
-    def start_listening(self, user_id):
-        """Starts the voice assistant in a separate thread."""
+    def start_listening(self, user_id, run_blocking=None):
+        """Starts the voice assistant on its session worker thread.
+
+        run_blocking, if given, runs the ElevenLabs/database setup (e.g. in a
+        thread pool); the session thread itself is always started from the
+        calling thread.
+        """
         if self.is_listening:
             return False, "Voice assistant is already listening"
 
+        # Supersede any previous session before touching shared state, so an
+        # old loop still running can't act on this session's behalf
+        self._generation += 1
+        generation = self._generation
+        # Drop transcripts (and any SHUTDOWN_SIGNAL) left from the last session
+        self._transcripts.clear()
+        self._transcript_ready.clear()
+        self._stopped.clear()
+
         self.user_id = user_id
         self.is_listening = True
         self.status = "Listening"
         self._log_to_frontend("🚀 Starting voice assistant...", 'info')
 
-        # Initialize ElevenLabs service
-        agent_initialized = initialize_elevenlabs_service()
+        try:
+            if run_blocking is None:
+                agent_initialized, conversation_id = self._open_session(user_id)
+            else:
+                agent_initialized, conversation_id = run_blocking(self._open_session, user_id)
+        except Exception:
+            self.is_listening = False
+            self.status = "Inactive"
+            self._stopped.set()
+            raise
+        self.conversation_id = conversation_id
+
         if agent_initialized:
             self._log_to_frontend("ElevenLabs Service initialized", 'success')
         else:
             self._log_to_frontend("Using fallback TTS", 'warning')
 
+        self._pending_session = (generation, user_id, conversation_id)
+        self._ensure_session_worker()
+        self._session_requested.set()
+
+        return True, "Voice assistant started successfully"
+
+    def _open_session(self, user_id):
+        """Blocking part of start_listening: TTS init and the conversation row."""
+        agent_initialized = initialize_elevenlabs_service()
+
         with _flask_app_instance.app_context():
             session_id = str(uuid.uuid4())
             new_db_conversation = DBConversation(user_id=user_id, session_id=session_id)
             db.session.add(new_db_conversation)
             db.session.commit()
-            self.conversation_id = new_db_conversation.id
+            conversation_id = new_db_conversation.id
 
-        self.listening_thread = threading.Thread(target=self._listening_loop, daemon=True)
-        self.listening_thread.start()
+        return agent_initialized, conversation_id
 
-        return True, "Voice assistant started successfully"
+    def wait_stopped(self, timeout=None):
+        """Block until the listening loop has exited; returns False on timeout."""
+        return self._stopped.wait(timeout)
+
+    def _ensure_session_worker(self):
+        with self._worker_lock:
+            if self.listening_thread is None or not self.listening_thread.is_alive():
+                # Daemon so a session still listening never blocks interpreter exit
+                self.listening_thread = threading.Thread(
+                    target=self._session_worker, name='voice-session', daemon=True
+                )
+                self.listening_thread.start()
+
+    def _session_worker(self):
+        """Run each requested listening session in turn on this one thread."""
+        while True:
+            self._session_requested.wait()
+            self._session_requested.clear()
+            self._listening_session(*self._pending_session)
+
+    def _listening_session(self, generation, user_id, conversation_id):
+        """Run the listening loop and signal waiters once it has fully exited.
 
-    def _listening_loop(self):
-        """The main listening and processing loop."""
+        A session superseded by a newer start leaves _stopped alone, since it
+        now belongs to the session queued behind it.
+        """
+        try:
+            self._listening_loop(generation, user_id, conversation_id)
+        finally:
+            if self._is_current(generation):
+                self._stopped.set()
+
+    def _is_current(self, generation):
+        return generation == self._generation
+
+    def _listening_loop(self, generation, user_id, conversation_id):
+        """The main listening and processing loop for one session.
+
+        Uses the session's own user_id/conversation_id rather than self.*,
+        which a newer start may already have replaced.
+        """
         global conversation_active
 
         with _flask_app_instance.app_context():
-            user = User.query.get(self.user_id)
+            user = db.session.get(User, user_id)
             user_name = user.username if user else "User"
 
         self._log_to_frontend("Voice assistant session started.", 'success')
@@ -772,39 +867,44 @@ class VoiceAssistant:
         initial_greeting = "Hello! I'm your ElevenLabs powered voice assistant. How can I help you today?"
         self._play_text_via_modern_api(initial_greeting)
 
-        while self.is_listening:
+        # One responder per session rather than one per transcript
+        simple_assistant = SimpleVoiceAssistant(user_id, conversation_id)
+
+        while self.is_listening and self._is_current(generation):
+            if not self._transcripts:
+                self._transcript_ready.wait(timeout=1)
+                self._transcript_ready.clear()
+                continue
             try:
-                transcript = self.user_transcript_queue.get(timeout=1)
+                transcript = self._transcripts.popleft()
                 
                 if transcript == "SHUTDOWN_SIGNAL":
                     self._log_to_frontend("Shutting down voice assistant...", 'status')
-                    self.status = "Inactive"
+                    if self._is_current(generation):
+                        self.status = "Inactive"
                     break
 
                 self._log_to_frontend(f"User: {transcript}", 'info')
-                self._log_to_database(self.user_id, 'USER', transcript, self.conversation_id)
+                self._log_to_database(user_id, 'USER', transcript, conversation_id)
 
-                # Create simple assistant instance for processing
-                simple_assistant = SimpleVoiceAssistant(self.user_id, self.conversation_id)
                 response_text = simple_assistant._simulate_llm_response(transcript)
                 
                 self._log_to_frontend(f"Assistant: {response_text}", 'info')
-                self._log_to_database(self.user_id, 'ASSISTANT', response_text, self.conversation_id)
+                self._log_to_database(user_id, 'ASSISTANT', response_text, conversation_id)
                 
                 self._play_text_via_modern_api(response_text)
 
                 if "CONVERSATION_END" in response_text:
-                    self.is_listening = False
+                    if self._is_current(generation):
+                        self.is_listening = False
                     break
 
-            except queue.Empty:
-                time.sleep(0.5)
             except Exception as e:
                 clean_log(f"Error in listening loop: {e}", 'ERROR')
                 self._log_to_frontend("An unexpected error occurred.", 'error')
 
         self._log_to_frontend("Voice assistant session ended.", 'info')
-        self._log_to_database(self.user_id, 'INFO', "Voice assistant session ended.", self.conversation_id)
+        self._log_to_database(user_id, 'INFO', "Voice assistant session ended.", conversation_id)
 
     def stop_listening(self):
         """Stops the voice assistant."""
@@ -815,10 +915,7 @@ class VoiceAssistant:
         self.status = "Inactive"
         self._log_to_frontend("Voice assistant stopped.", 'info')
         
-        try:
-            self.user_transcript_queue.put("SHUTDOWN_SIGNAL")
-        except:
-            pass
+        self.submit_transcript("SHUTDOWN_SIGNAL", force=True)
             
         return True, "Voice assistant stopped"
 
@@ -828,7 +925,8 @@ class VoiceAssistant:
             return False, "Voice assistant is not currently active"
         
         try:
-            self.user_transcript_queue.put(transcript)
+            if not self.submit_transcript(transcript):
+                return False, "Too many transcripts waiting to be processed"
             return True, "Transcript processed successfully"
         except Exception as e:
             logger.error(f"Error processing transcript: {e}")
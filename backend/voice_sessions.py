@@ -0,0 +1,190 @@
+"""
+Voice session state shared by the voice API endpoints.
+Uses Redis when it is installed and reachable so every worker sees the same
+sessions, and falls back to an in-process dictionary otherwise. Browser
+clients also carry their session in a signed, timestamped cookie; it is only
+a hint (e.g. for the start time), the store stays the source of truth.
+"""
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional
+
+import orjson
+from cachetools import TTLCache
+from itsdangerous import BadSignature, URLSafeTimedSerializer
+
+from .integration_utils import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+# Sessions not touched for this long are dropped, so abandoned ones don't
+# accumulate for the life of the process
+SESSION_TTL_SECONDS = 3600
+MAX_SESSIONS = 10_000
+
+class InMemoryVoiceSessionStore:
+    """Per-process voice sessions in a bounded TTL cache guarded by a lock."""
+
+    backend = 'memory'
+
+    def __init__(self, ttl: int = SESSION_TTL_SECONDS, maxsize: int = MAX_SESSIONS):
+        self._sessions: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.Lock()
+
+    def get(self, user_id) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            session = self._sessions.get(str(user_id))
+            return dict(session) if session is not None else None
+
+    def set(self, user_id, data: Dict[str, Any]) -> None:
+        with self._lock:
+            self._sessions[str(user_id)] = dict(data)
+
+    def set_default(self, user_id, data: Dict[str, Any]) -> None:
+        """Create the session only if the user doesn't have one yet."""
+        with self._lock:
+            if str(user_id) not in self._sessions:
+                self._sessions[str(user_id)] = dict(data)
+
+    def update(self, user_id, **fields) -> bool:
+        """Merge fields into an existing session; returns False if there is none."""
+        key = str(user_id)
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is None:
+                return False
+            session.update(fields)
+            # Reassign so the update also renews the TTL
+            self._sessions[key] = session
+            return True
+
+    def active_count(self) -> int:
+        with self._lock:
+            self._sessions.expire()
+            return sum(1 for session in self._sessions.values() if session.get('active'))
+
+class RedisVoiceSessionStore:
+    """Voice sessions kept as one Redis hash per user, with a TTL.
+
+    Each field holds an orjson-encoded value, so single fields can be
+    updated in place; the conditional writes run as Lua scripts and are
+    atomic without WATCH retries. Users with an active session are also
+    tracked in a sorted set scored by expiry time, for active_count().
+    """
+
+    backend = 'redis'
+    prefix = 'vs:'
+    active_key = 'vs:active'
+
+    # KEYS[1] session hash, KEYS[2] active set; ARGV: mode (set/default/update),
+    # ttl, user id, expiry, active flag (1/0, or -1 = unchanged but renew),
+    # then field/value pairs
+    _WRITE_LUA = """
+    local unpack = table.unpack or unpack  -- 5.1 global vs. 5.2+ (e.g. fakeredis)
+    local mode = ARGV[1]
+    local exists = redis.call('EXISTS', KEYS[1]) == 1
+    if (mode == 'update' and not exists) or (mode == 'default' and exists) then
+        return 0
+    end
+    if mode == 'set' then redis.call('DEL', KEYS[1]) end
+    redis.call('HSET', KEYS[1], unpack(ARGV, 6))
+    redis.call('EXPIRE', KEYS[1], ARGV[2])
+    if ARGV[5] == '1' then
+        redis.call('ZADD', KEYS[2], ARGV[4], ARGV[3])
+    elseif ARGV[5] == '0' then
+        redis.call('ZREM', KEYS[2], ARGV[3])
+    else
+        redis.call('ZADD', KEYS[2], 'XX', ARGV[4], ARGV[3])
+    end
+    return 1
+    """
+
+    def __init__(self, client, ttl: int = SESSION_TTL_SECONDS):
+        self._redis = client
+        self._ttl = ttl
+        self._write = client.register_script(self._WRITE_LUA)
+
+    def _key(self, user_id) -> str:
+        return f"{self.prefix}{user_id}"
+
+    def _run_write(self, mode: str, user_id, data: Dict[str, Any]) -> bool:
+        if mode != 'update' or 'active' in data:
+            active = '1' if data.get('active') else '0'
+        else:
+            active = '-1'
+        args = [mode, self._ttl, str(user_id), time.time() + self._ttl, active]
+        for field, value in data.items():
+            args += [field, orjson.dumps(value)]
+        return bool(self._write(keys=[self._key(user_id), self.active_key], args=args))
+
+    def get(self, user_id) -> Optional[Dict[str, Any]]:
+        raw = self._redis.hgetall(self._key(user_id))
+        if not raw:
+            return None
+        return {field.decode(): orjson.loads(value) for field, value in raw.items()}
+
+    def set(self, user_id, data: Dict[str, Any]) -> None:
+        self._run_write('set', user_id, data)
+
+    def set_default(self, user_id, data: Dict[str, Any]) -> None:
+        self._run_write('default', user_id, data)
+
+    def update(self, user_id, **fields) -> bool:
+        return self._run_write('update', user_id, fields)
+
+    def active_count(self) -> int:
+        # Entries whose session hash has expired fall out by score
+        now = time.time()
+        self._redis.zremrangebyscore(self.active_key, '-inf', now)
+        return self._redis.zcard(self.active_key)
+
+def create_voice_session_store(redis_url: Optional[str] = None):
+    """Return a Redis-backed store if redis_url is reachable, else an in-memory one."""
+    client = get_redis_client(redis_url)
+    if client is not None:
+        logger.info("Voice sessions stored in Redis")
+        return RedisVoiceSessionStore(client)
+    return InMemoryVoiceSessionStore()
+
+class VoiceSessionCookie:
+    """Signed, client-held copy of a user's voice session.
+
+    The payload is tiny ('u' user id, 'a' active, 't' started_at_ns,
+    's' stopped_at_ns) and is bound to the user id, so a cookie left over
+    from another account is ignored rather than trusted. The signature is
+    timestamped and checked against ttl, so an old cookie can't be replayed
+    after max_age even though the secret key hasn't changed.
+    """
+
+    name = 'voice_session'
+
+    def __init__(self, secret_key: str, ttl: int = SESSION_TTL_SECONDS):
+        self._serializer = URLSafeTimedSerializer(secret_key, salt='voice-session')
+        self._ttl = ttl
+
+    def load(self, request, user_id) -> Optional[Dict[str, Any]]:
+        raw = request.cookies.get(self.name)
+        if not raw:
+            return None
+        try:
+            data = self._serializer.loads(raw, max_age=self._ttl)
+        except BadSignature:  # Includes SignatureExpired
+            return None
+        if not isinstance(data, dict) or data.get('u') != str(user_id):
+            return None
+        return {
+            'active': bool(data.get('a')),
+            'started_at_ns': data.get('t'),
+            'stopped_at_ns': data.get('s'),
+        }
+
+    def save(self, response, user_id, data: Dict[str, Any]):
+        token = self._serializer.dumps({
+            'u': str(user_id),
+            'a': bool(data.get('active')),
+            't': data.get('started_at_ns'),
+            's': data.get('stopped_at_ns'),
+        })
+        response.set_cookie(self.name, token, max_age=self._ttl, httponly=True, samesite='Lax')
+        return response
@@ -48,6 +48,10 @@ const App = () => {
             addLog(data.message, data.level);
         };
 
+        const onLogBatch = (batch) => {
+            batch.forEach(onLog);
+        };
+
         const onStatusUpdate = (data) => {
             setStatus(data.status);
             if (data.status === 'Listening...') {
@@ -66,6 +70,7 @@ const App = () => {
         socket.on('connect', onConnect);
         socket.on('disconnect', onDisconnect);
         socket.on('log', onLog);
+        socket.on('log_batch', onLogBatch);
         socket.on('status_update', onStatusUpdate);
         socket.on('voice_error', onVoiceError);
         socket.on('voice_status', onStatusUpdate);
@@ -74,6 +79,7 @@ const App = () => {
             socket.off('connect', onConnect);
             socket.off('disconnect', onDisconnect);
             socket.off('log', onLog);
+            socket.off('log_batch', onLogBatch);
             socket.off('status_update', onStatusUpdate);
             socket.off('voice_error', onVoiceError);
             socket.off('voice_status', onStatusUpdate);
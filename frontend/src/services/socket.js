@@ -1,7 +1,12 @@
 import { io } from 'socket.io-client';
+import msgpackParser from 'socket.io-msgpack-parser';
 
 const URL = import.meta.env.DEV ? 'http://localhost:5000' : '/'; 
 
+// Must match the backend's SOCKETIO_SERIALIZER setting
+const useMsgpack = import.meta.env.VITE_SOCKETIO_SERIALIZER === 'msgpack';
+
 export const socket = io(URL, {
     autoConnect: true,
+    ...(useMsgpack ? { parser: msgpackParser } : {}),
 });
\ No newline at end of file